@@ -1,10 +1,13 @@
-%module cxtgeo
+%module(threads="1") cxtgeo
 %{
 #define SWIG_FILE_WITH_INIT
 #include <libxtg.h>
 static PyObject* PY_XTGeoCLibError;
 %}
 
+/* the python GIL is held in all C functions, except those enabled with %thread */
+%nothread;
+
 %pythoncallback;
 double euclid_length(const double, const double, const double, const double, const double, const double);
 double horizontal_length(const double, const double, const double, const double, const double, const double);
@@ -347,4 +350,7 @@ PyDict_SetItemString(d, "XTGeoCLibError", PY_XTGeoCLibError);
     XTGeoCLibError = _cxtgeo.XTGeoCLibError
 %}
 
+/* these are pure C and may run concurrently in python threads */
+%thread surf_sample_grd3d_lay;
+
 %include <libxtg.h>
@@ -5,8 +5,15 @@
 #include <stdlib.h>
 #include <string.h>
 
-static char error_message[256];
-static int error_status = 0;
+/* the error state is per thread, as some functions run without the python GIL */
+#if defined(_MSC_VER)
+#define XTG_THREAD_LOCAL __declspec(thread)
+#else
+#define XTG_THREAD_LOCAL __thread
+#endif
+
+static XTG_THREAD_LOCAL char error_message[256];
+static XTG_THREAD_LOCAL int error_status = 0;
 
 void
 throw_exception(char *msg)
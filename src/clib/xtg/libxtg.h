@@ -513,8 +513,8 @@ surf_slice_grd3d(int mcol,
                  long n_swig_np_dbl_in_v3,   // nzcorn,
                  int *swig_np_int_in_v1,     // *actnumsv,
                  long n_swig_np_int_in_v1,   // nactnum,
-
-                 double *p_prop_v,
+                 double *swig_np_dbl_in_v4,  // *p_prop_v
+                 long n_swig_np_dbl_in_v4,   // nprop
                  int buffer);
 
 int
@@ -1081,42 +1081,23 @@ double y_projection(const double x1, const double y1, const double z1, const dou
 double z_projection(const double x1, const double y1, const double z1, const double x2, const double y2, const double z2);
 
 int
-grdcp3d_calc_dx(int nx,
-                int ny,
-                int nz,
-                double *swig_np_dbl_in_v1,       // *coordsv,
-                long n_swig_np_dbl_in_v1,        // ncoord,
-                double *swig_np_dbl_in_v2,       // *zcornsv,
-                long n_swig_np_dbl_in_v2,        // nzcorn,
-                double *swig_np_dbl_inplace_v1,  // *dx,
-                long n_swig_np_dbl_inplace_v1,    // ntot,
-                metric m
-                );
-int
-grdcp3d_calc_dy(int nx,
-                int ny,
-                int nz,
-                double *swig_np_dbl_in_v1,       // *coordsv,
-                long n_swig_np_dbl_in_v1,        // ncoord,
-                double *swig_np_dbl_in_v2,       // *zcornsv,
-                long n_swig_np_dbl_in_v2,        // nzcorn,
-                double *swig_np_dbl_inplace_v1,  // *dy,
-                long n_swig_np_dbl_inplace_v1,    // ntot,
-                metric m
-                );
-
-int
-grdcp3d_calc_dz(int nx,
-                int ny,
-                int nz,
-                double *swig_np_dbl_in_v1,       // *coordsv,
-                long n_swig_np_dbl_in_v1,        // ncoord,
-                double *swig_np_dbl_in_v2,       // *zcornsv,
-                long n_swig_np_dbl_in_v2,        // nzcorn,
-                double *swig_np_dbl_inplace_v1,  // *dz,
-                long n_swig_np_dbl_inplace_v1,    // ntot,
-                metric m
-                );
+grdcp3d_calc_dxdydz(int nx,
+                    int ny,
+                    int nz,
+                    double *swig_np_dbl_in_v1,       // *coordsv,
+                    long n_swig_np_dbl_in_v1,        // ncoord,
+                    double *swig_np_dbl_in_v2,       // *zcornsv,
+                    long n_swig_np_dbl_in_v2,        // nzcorn,
+                    double *swig_np_dbl_inplace_v1,  // *dx,
+                    long n_swig_np_dbl_inplace_v1,   // ndx,
+                    double *swig_np_dbl_inplace_v2,  // *dy,
+                    long n_swig_np_dbl_inplace_v2,   // ndy,
+                    double *swig_np_dbl_inplace_v3,  // *dz,
+                    long n_swig_np_dbl_inplace_v3,   // ndz,
+                    metric mx,
+                    metric my,
+                    metric mz
+                    );
 
 void
 grd3d_calc_xyz(int nx,
@@ -1354,21 +1335,6 @@ grd3d_make_z_consistent(int nx,
                         long n_swig_np_dbl_inplace_v1,   // nzcorn
                         double zsep);
 
-int
-grd3d_translate(int nx,
-                int ny,
-                int nz,
-                int xflip,
-                int yflip,
-                int zflip,
-                double xshift,
-                double yshift,
-                double zshift,
-                double *swig_np_dbl_inplace_v1,  // *coordsv
-                long n_swig_np_dbl_inplace_v1,   // ncoord
-                double *swig_np_dbl_inplace_v2,  // *zcornsv
-                long n_swig_np_dbl_inplace_v2);  // nzcorn
-
 int
 grd3d_reverse_jrows(int nx,
                     int ny,
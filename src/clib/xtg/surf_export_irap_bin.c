@@ -148,19 +148,31 @@ surf_export_irap_bin(FILE *fc,
     /* record length */
     int nrec = mx * sizeof(float);
 
+    /* each record (one row) is converted in a buffer and written in one go */
+    float *row = calloc(mx, sizeof(float));
+    if (row == NULL) {
+        throw_exception("Could not allocate memory in: surf_export_irap_bin");
+        return EXIT_FAILURE;
+    }
+
     long ib = 0;
     int j;
     for (j = 1; j <= my; j++) {
 
         _writeint(fc, nrec, swap);
 
-        for (i = 1; i <= mx; i++) {
-            _writefloat(fc, (float)p_map_v[ib], swap);
-            ib++;
+        for (i = 0; i < mx; i++) {
+            row[i] = (float)p_map_v[ib++];
+            if (swap)
+                SWAP_FLOAT(row[i]);
+        }
+        if (fwrite(row, sizeof(float), mx, fc) != (size_t)mx) {
+            logger_critical(LI, FI, FU, "Cannot write float to file! <%s>", FU);
         }
 
         _writeint(fc, nrec, swap);
     }
 
+    free(row);
     return EXIT_SUCCESS;
 }
@@ -151,6 +151,10 @@ surf_sample_grd3d_lay(int nx,
                     xpos = xori + xinc * (ii - 1);
                     ypos = yori + yinc * (jj - 1);
 
+                    /* a node outside the cell's XY bounding box cannot be inside */
+                    if (xpos < cxmin || xpos > cxmax || ypos < cymin || ypos > cymax)
+                        continue;
+
                     zval = x_sample_z_from_xy_cell(corners_v, xpos, ypos, mode, 0);
 
                     if (zval < UNDEF_LIMIT && zval > -1 * UNDEF_LIMIT) {
@@ -34,6 +34,108 @@
 #include "libxtg.h"
 #include "libxtg_.h"
 #include "logger.h"
+#include <math.h>
+
+/* tolerance in map node units when finding the nodes covered by a cell column */
+#define NODE_EPS 1.0e-6
+
+/*
+ * The range of the cell corners projected (relative to corner 0) on the two unit
+ * normals of the averaged cell edges in I and J direction. The exact point in cell
+ * test only accepts points inside the convex hull of the corners, so a point
+ * outside one of these ranges cannot be in the cell. The ranges are widened with a
+ * small fraction of their width to be safe against round-off.
+ */
+static void
+_cell_slabs(double *corners, double *snx, double *sny, double *smin, double *smax)
+{
+    int n, ic;
+    double ex, ey, len, proj, tol;
+
+    for (n = 0; n < 2; n++) {
+        /* edges 0-1 and 2-3 are along I, edges 0-2 and 1-3 along J (top and base) */
+        if (n == 0) {
+            ex = corners[3] - corners[0] + corners[9] - corners[6] + corners[15] -
+                 corners[12] + corners[21] - corners[18];
+            ey = corners[4] - corners[1] + corners[10] - corners[7] + corners[16] -
+                 corners[13] + corners[22] - corners[19];
+        } else {
+            ex = corners[6] - corners[0] + corners[9] - corners[3] + corners[18] -
+                 corners[12] + corners[21] - corners[15];
+            ey = corners[7] - corners[1] + corners[10] - corners[4] + corners[19] -
+                 corners[13] + corners[22] - corners[16];
+        }
+        len = sqrt(ex * ex + ey * ey);
+        if (len > 0.0) {
+            snx[n] = -ey / len;
+            sny[n] = ex / len;
+        } else {
+            snx[n] = 0.0;
+            sny[n] = 0.0;
+        }
+
+        smin[n] = 0.0;
+        smax[n] = 0.0;
+        for (ic = 1; ic < 8; ic++) {
+            proj = (corners[3 * ic] - corners[0]) * snx[n] +
+                   (corners[3 * ic + 1] - corners[1]) * sny[n];
+            if (proj < smin[n])
+                smin[n] = proj;
+            if (proj > smax[n])
+                smax[n] = proj;
+        }
+        tol = 1.0e-6 * (smax[n] - smin[n]) + 1.0e-9;
+        smin[n] -= tol;
+        smax[n] += tol;
+    }
+}
+
+/* first layer in column i, j where the cell top is below zval; nlay + 1 if none */
+static int
+_first_layer_below(int i,
+                   int j,
+                   int ncol,
+                   int nrow,
+                   int nlay,
+                   double *zcornsv,
+                   double zval)
+{
+    int klo = 1, khi = nlay + 1, kmid;
+
+    while (klo < khi) {
+        kmid = (klo + khi) / 2;
+        if (grd3d_zminmax(i, j, kmid, ncol, nrow, nlay, zcornsv, 0) > zval) {
+            khi = kmid;
+        } else {
+            klo = kmid + 1;
+        }
+    }
+    return klo;
+}
+
+/* last layer up to kmax in column i, j where the cell base is above zval; 0 if none */
+static int
+_last_layer_above(int i,
+                  int j,
+                  int ncol,
+                  int nrow,
+                  int nlay,
+                  double *zcornsv,
+                  double zval,
+                  int kmax)
+{
+    int klo = 0, khi = kmax, kmid;
+
+    while (klo < khi) {
+        kmid = (klo + khi + 1) / 2;
+        if (grd3d_zminmax(i, j, kmid, ncol, nrow, nlay, zcornsv, 1) < zval) {
+            klo = kmid;
+        } else {
+            khi = kmid - 1;
+        }
+    }
+    return klo;
+}
 
 int
 surf_slice_grd3d(int mcol,
@@ -58,17 +160,30 @@ surf_slice_grd3d(int mcol,
                  int *actnumsv,
                  long nact,
                  double *p_prop_v,
+                 long nprop,
                  int buffer)
 {
 
     int j, k, kc1, kc2, kstep = 0, ier, ier3, ios, ix;
     int imm, im, jm, im1, im2, jm1, jm2;
     double corners[24];
-    double rx, ry, cellvalue, xm, ym, zm, zgrdtop, zgrdbot;
+    double cellvalue, xm, ym, zm, zgrdtop, zgrdbot;
     double zmapmin, zmapmax;
     double xc[8], yc[8];
+    double cmin[3], cmax[3];
+    double snx[2], sny[2], smin[2], smax[2], proj;
+    double dx, dy, um, vm, umin, umax, vmin, vmax, cosa, sina;
+    double *xmv, *ymv, *zmv;
     long ib, ic, nactive = 0;
 
+    if (nprop != (long)ncol * nrow * nlay) {
+        throw_exception("Incorrect size of property in surf_slice_grd3d.");
+        return EXIT_FAILURE;
+    }
+
+    cosa = cos(rotation * PI / 180.0);
+    sina = sin(rotation * PI / 180.0);
+
     /* determine Z window for map (could speed up if flat OWC contact) */
     ier = surf_zminmax(mcol, mrow, p_slice_v, &zmapmin, &zmapmax);
 
@@ -78,6 +193,30 @@ surf_slice_grd3d(int mcol,
     for (ic = 0; ic < mcol * mrow; ic++)
         p_map_v[ic] = UNDEF;
 
+    /* the map node coordinates are the same for every grid cell, so compute them
+       once; nodes that cannot be sampled get UNDEF as z */
+    xmv = calloc(mcol * mrow, sizeof(double));
+    ymv = calloc(mcol * mrow, sizeof(double));
+    zmv = calloc(mcol * mrow, sizeof(double));
+    if (xmv == NULL || ymv == NULL || zmv == NULL) {
+        free(xmv);
+        free(ymv);
+        free(zmv);
+        throw_exception("Could not allocate memory in surf_slice_grd3d");
+        return EXIT_FAILURE;
+    }
+
+    for (im = 1; im <= mcol; im++) {
+        for (jm = 1; jm <= mrow; jm++) {
+            imm = x_ijk2ic(im, jm, 1, mcol, mrow, 1, 0);
+            ier3 = surf_xyz_from_ij(im, jm, &xm, &ym, &zm, xori, xinc, yori, yinc,
+                                    mcol, mrow, yflip, rotation, p_slice_v, mslice, 0);
+            xmv[imm] = xm;
+            ymv[imm] = ym;
+            zmv[imm] = (ier3 == 0 && zm < UNDEF_LIMIT) ? zm : UNDEF;
+        }
+    }
+
     /* loop grid3d columns innermost, and find approximate area for map
        to search */
 
@@ -95,28 +234,28 @@ surf_slice_grd3d(int mcol,
             if (zgrdtop > zmapmax)
                 continue;
 
-            kc1 = 1;
-            kc2 = 0;
-            nactive = 0;
-            for (k = 1; k <= nlay; k++) {
+            /* the layers that may intersect the map z range; found by bisection
+               as the cell top and base z values increase downwards in a column */
+            kc2 = _first_layer_below(i, j, ncol, nrow, nlay, zcornsv, zmapmax);
+            if (kc2 > nlay)
+                kc2 = nlay;
+            kc1 = _last_layer_above(i, j, ncol, nrow, nlay, zcornsv, zmapmin, kc2);
+            if (kc1 < 1)
+                kc1 = 1;
 
+            nactive = 0;
+            for (k = kc1; k <= kc2; k++) {
                 ib = x_ijk2ib(i, j, k, ncol, nrow, nlay, 0);
                 if (ib < 0) {
+                    free(xmv);
+                    free(ymv);
+                    free(zmv);
                     throw_exception("Loop through layers gave index outside boundary "
                                     "in surf_slice_grd3d");
                     return EXIT_FAILURE;
                 }
-                if (actnumsv[ib] == 1)
+                if (actnumsv[ib] == 1) {
                     nactive++;
-
-                zgrdtop = grd3d_zminmax(i, j, k, ncol, nrow, nlay, zcornsv, 0);
-                zgrdbot = grd3d_zminmax(i, j, k, ncol, nrow, nlay, zcornsv, 1);
-
-                if (zgrdbot < zmapmin)
-                    kc1 = k;
-                if (zgrdtop > zmapmax) {
-                    kc2 = k;
-
                     break;
                 }
             }
@@ -124,9 +263,6 @@ surf_slice_grd3d(int mcol,
             if (nactive == 0)
                 continue;
 
-            if (kc1 > kc2)
-                kc2 = nlay;
-
             grd3d_corners(i, j, kc1, ncol, nrow, nlay, coordsv, 0, zcornsv, 0, corners);
             kstep = 0;
             for (ix = 0; ix < 4; ix++) {
@@ -143,28 +279,37 @@ surf_slice_grd3d(int mcol,
                 kstep = kstep + 2;
             }
 
-            /* find widest range in map nodes to cover this cell column
-               which will be the upper and lower cell */
-            im1 = mcol;
-            im2 = 1;
-            jm1 = mrow;
-            jm2 = 1;
+            /* find the range of map nodes that covers this cell column, which
+               will be the upper and lower cell; the column corners are mapped to
+               continuous (1-based) map node coordinates so that no node inside
+               the column is missed, also when corners are outside the map */
+            umin = vmin = VERYLARGEPOSITIVE;
+            umax = vmax = VERYLARGENEGATIVE;
 
             for (ix = 0; ix < 8; ix++) {
-                ier = sucu_ij_from_xy(&im, &jm, &rx, &ry, xc[ix], yc[ix], xori, xinc,
-                                      yori, yinc, mcol, mrow, yflip, rotation, 0);
-                if (ier == 0) {
-                    if (im < im1)
-                        im1 = im;
-                    if (im > im2)
-                        im2 = im;
-                    if (jm < jm1)
-                        jm1 = jm;
-                    if (jm > jm2)
-                        jm2 = jm;
-                }
+                dx = xc[ix] - xori;
+                dy = yc[ix] - yori;
+                um = (dx * cosa + dy * sina) / xinc + 1.0;
+                vm = (dy * cosa - dx * sina) / (yinc * yflip) + 1.0;
+                if (um < umin)
+                    umin = um;
+                if (um > umax)
+                    umax = um;
+                if (vm < vmin)
+                    vmin = vm;
+                if (vm > vmax)
+                    vmax = vm;
             }
 
+            if (umax < 1.0 - NODE_EPS || umin > mcol + NODE_EPS ||
+                vmax < 1.0 - NODE_EPS || vmin > mrow + NODE_EPS)
+                continue;
+
+            im1 = (int)ceil(umin - NODE_EPS);
+            im2 = (int)floor(umax + NODE_EPS);
+            jm1 = (int)ceil(vmin - NODE_EPS);
+            jm2 = (int)floor(vmax + NODE_EPS);
+
             /* extend with buffer nodes to be certain */
             im1 -= buffer;
             im2 += buffer;
@@ -180,12 +325,11 @@ surf_slice_grd3d(int mcol,
                 jm2 = mrow;
 
             for (k = kc1; k <= kc2; k++) {
-                /* get map cell corners: */
-                grd3d_corners(i, j, k, ncol, nrow, nlay, coordsv, 0, zcornsv, 0,
-                              corners);
-
                 ib = x_ijk2ib(i, j, k, ncol, nrow, nlay, 0);
                 if (ib < 0) {
+                    free(xmv);
+                    free(ymv);
+                    free(zmv);
                     throw_exception("Loop through layers gave index outside boundary "
                                     "in surf_slice_grd3d");
                     return EXIT_FAILURE;
@@ -196,31 +340,58 @@ surf_slice_grd3d(int mcol,
                     continue;
                 }
 
+                /* get map cell corners: */
+                grd3d_corners(i, j, k, ncol, nrow, nlay, coordsv, 0, zcornsv, 0,
+                              corners);
+
+                /* bounding box of the cell, to skip nodes before the full test */
+                for (ix = 0; ix < 3; ix++) {
+                    cmin[ix] = corners[ix];
+                    cmax[ix] = corners[ix];
+                }
+                for (ic = 3; ic < 24; ic++) {
+                    if (corners[ic] < cmin[ic % 3])
+                        cmin[ic % 3] = corners[ic];
+                    if (corners[ic] > cmax[ic % 3])
+                        cmax[ic % 3] = corners[ic];
+                }
+
+                _cell_slabs(corners, snx, sny, smin, smax);
+
                 for (im = im1; im <= im2; im++) {
                     for (jm = jm1; jm <= jm2; jm++) {
-                        ier3 = surf_xyz_from_ij(im, jm, &xm, &ym, &zm, xori, xinc, yori,
-                                                yinc, mcol, mrow, yflip, rotation,
-                                                p_slice_v, mslice, 0);
-
-                        if (ier3 == 0 && zm < UNDEF_LIMIT) {
-
-                            ios = x_chk_point_in_cell(xm, ym, zm, corners, 0);
-
-                            if (ios > 0) {
-                                imm = x_ijk2ic(im, jm, 1, mcol, mrow, 1, 0);
-                                if (imm < 0) {
-                                    throw_exception("Loop gave index outside boundary "
-                                                    "in surf_slice_grd3d");
-                                    return EXIT_FAILURE;
-                                }
-                                p_map_v[imm] = cellvalue;
-                            }
-                        }
+                        imm = x_ijk2ic(im, jm, 1, mcol, mrow, 1, 0);
+                        zm = zmv[imm];
+                        if (zm < cmin[2] || zm > cmax[2])
+                            continue;
+                        xm = xmv[imm];
+                        ym = ymv[imm];
+                        if (xm < cmin[0] || xm > cmax[0] || ym < cmin[1] ||
+                            ym > cmax[1])
+                            continue;
+
+                        /* skip nodes outside the cell seen along its edges */
+                        dx = xm - corners[0];
+                        dy = ym - corners[1];
+                        proj = dx * snx[0] + dy * sny[0];
+                        if (proj < smin[0] || proj > smax[0])
+                            continue;
+                        proj = dx * snx[1] + dy * sny[1];
+                        if (proj < smin[1] || proj > smax[1])
+                            continue;
+
+                        ios = x_chk_point_in_cell(xm, ym, zm, corners, 0);
+
+                        if (ios > 0)
+                            p_map_v[imm] = cellvalue;
                     }
                 }
             }
         }
     }
 
+    free(xmv);
+    free(ymv);
+    free(zmv);
     return EXIT_SUCCESS;
 }
@@ -37,6 +37,7 @@ In addition there are other classes:
 import os
 import sys
 import re
+import functools
 from datetime import datetime as dtime
 import getpass
 import platform
@@ -63,6 +64,12 @@ BOLD = "\033[1m"
 UNDERLINE = "\033[4m"
 
 
+@functools.lru_cache(maxsize=None)
+def _is_testpath(tstpath):
+    """Check (once per path) that the test data folder exists"""
+    return os.path.isdir(tstpath)
+
+
 def _printdebug(*args):
     """local unction to print debugging while initializing logging"""
 
@@ -420,14 +427,15 @@ class XTGeoDialog(object):  # pylint: disable=too-many-public-methods
         """Get the logger for functions (not top level)."""
 
         logger = logging.getLogger(name)
-        logger.addHandler(logging.NullHandler())
+        if not any(isinstance(hdl, logging.NullHandler) for hdl in logger.handlers):
+            logger.addHandler(logging.NullHandler())
         return logger
 
     def testsetup(self):
         """Basic setup for XTGeo testing (private; only relevant for tests)"""
 
         tstpath = os.environ.get("XTG_TESTPATH", "../xtgeo-testdata")
-        if not os.path.isdir(tstpath):
+        if not _is_testpath(tstpath):
             raise RuntimeError("Test path is not valid: {}".format(tstpath))
 
         self._test_env = True
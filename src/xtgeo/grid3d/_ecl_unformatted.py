@@ -0,0 +1,167 @@
+"""Bulk reading of unformatted (binary) ecl files, e.g. EGRID.
+
+An unformatted ecl file is a sequence of fortran records. Each keyword has a
+16 byte header record with name, length and type, followed by the values in
+records of at most 1000 items (105 for strings), each record enclosed by big
+endian byte counts.
+
+The whole file is read into memory in one go, and the values of each record
+group are decoded with one strided numpy view instead of one read per record.
+The entries have the same interface as those of :func:`ecl_data_io.lazy_read`.
+"""
+import struct
+
+import numpy as np
+from ecl_data_io import MESS, EclParsingError
+
+HEADER = struct.Struct(">i8si4si")
+MARKER = struct.Struct(">i")
+
+DTYPES = {
+    b"INTE": np.dtype(">i4"),
+    b"REAL": np.dtype(">f4"),
+    b"LOGI": np.dtype(">i4"),
+    b"DOUB": np.dtype(">f8"),
+    b"CHAR": np.dtype("S8"),
+}
+
+
+def _np_dtype(kwtype):
+    """The numpy dtype of an ecl type, or None if not a type with values."""
+    if kwtype[0:2] == b"C0" and kwtype[2:4].isdigit():
+        return np.dtype("S" + kwtype[2:4].decode("ascii"))
+    return DTYPES.get(kwtype)
+
+
+def _group_len(kwtype):
+    return 105 if kwtype[0:1] == b"C" else 1000
+
+
+class UnformattedEntry:
+    """One keyword in an unformatted ecl file held in a memory buffer."""
+
+    def __init__(self, buffer, keyword, kwtype, length, data_start):
+        self._buffer = buffer
+        self._keyword = keyword
+        self._type = kwtype
+        self._length = length
+        self._data_start = data_start
+
+    def read_keyword(self):
+        return self._keyword
+
+    def read_type(self):
+        return self._type
+
+    def read_length(self):
+        return self._length
+
+    def read_array(self):
+        """Decode the values of the keyword as a numpy array (copy)."""
+        if self._type == b"MESS":
+            return MESS
+
+        dtype = _np_dtype(self._type)
+        group = _group_len(self._type)
+        group_bytes = group * dtype.itemsize
+        nfull, rest = divmod(self._length, group)
+
+        array = np.empty(self._length, dtype=dtype)
+        offset = self._data_start
+        if nfull > 0:
+            # all full records have the same size, so they form a strided view
+            stride = group_bytes + 2 * MARKER.size
+            markers = np.ndarray(
+                (nfull, 2),
+                dtype=">i4",
+                buffer=self._buffer,
+                offset=offset,
+                strides=(stride, group_bytes + MARKER.size),
+            )
+            if np.any(markers != group_bytes):
+                raise EclParsingError(
+                    f"Unexpected size of record in keyword {self._keyword}"
+                )
+            array[: nfull * group] = np.ndarray(
+                (nfull, group),
+                dtype=dtype,
+                buffer=self._buffer,
+                offset=offset + MARKER.size,
+                strides=(stride, dtype.itemsize),
+            ).ravel()
+            offset += nfull * stride
+        if rest > 0:
+            rest_bytes = rest * dtype.itemsize
+            first = MARKER.unpack_from(self._buffer, offset)[0]
+            last = MARKER.unpack_from(self._buffer, offset + MARKER.size + rest_bytes)
+            if first != rest_bytes or last[0] != rest_bytes:
+                raise EclParsingError(
+                    f"Unexpected size of record in keyword {self._keyword}"
+                )
+            array[nfull * group :] = np.frombuffer(
+                self._buffer, dtype=dtype, count=rest, offset=offset + MARKER.size
+            )
+
+        if self._type == b"LOGI":
+            array = array.astype(np.bool_)
+        return array
+
+
+def _data_size(kwtype, length):
+    """Number of bytes of the value records of a keyword."""
+    if length == 0:
+        return 0
+    nrecords = -(-length // _group_len(kwtype))
+    return length * _np_dtype(kwtype).itemsize + nrecords * 2 * MARKER.size
+
+
+def _read_header(buffer, offset):
+    if offset + HEADER.size > len(buffer):
+        raise EclParsingError("Reached end-of-file while reading keyword")
+    start, keyword, length, kwtype, end = HEADER.unpack_from(buffer, offset)
+    if start != 16 or end != 16:
+        raise EclParsingError(f"Unexpected size of record {start} at {offset}")
+    return keyword.decode("ascii"), length, kwtype
+
+
+def lazy_read_unformatted(filelike):
+    """Generate the keyword entries of an unformatted ecl file.
+
+    Args:
+        filelike (str, Path or byte stream): The file to read from.
+    Yields:
+        UnformattedEntry for each keyword, values are decoded on read_array().
+    Raises:
+        EclParsingError: If the file is truncated or has malformed records.
+    """
+    if hasattr(filelike, "read"):
+        buffer = filelike.read()
+    else:
+        with open(filelike, "rb") as stream:
+            buffer = stream.read()
+
+    offset = 0
+    while offset < len(buffer):
+        keyword, length, kwtype = _read_header(buffer, offset)
+        offset += HEADER.size
+        if kwtype == b"X231":
+            # more than 2**31 values, the length continues in the next header
+            keyword2, length2, kwtype = _read_header(buffer, offset)
+            if keyword2 != keyword:
+                raise EclParsingError(
+                    f"x231 type record was not followed by record with same "
+                    f"keyword, found {keyword2} expected {keyword}"
+                )
+            length = -length * 2**31 + length2
+            offset += HEADER.size
+
+        if length != 0 and _np_dtype(kwtype) is None:
+            raise EclParsingError(f"Unexpected item type {kwtype} in keyword {keyword}")
+        data_size = _data_size(kwtype, length)
+        if offset + data_size > len(buffer):
+            raise EclParsingError(
+                f"Reached end-of-file while reading values of {keyword}"
+            )
+
+        yield UnformattedEntry(buffer, keyword, kwtype, length, offset)
+        offset += data_size
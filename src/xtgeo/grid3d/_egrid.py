@@ -64,6 +64,7 @@ from ._ecl_grid import (
     Units,
 )
 from ._ecl_output_file import TypeOfGrid
+from ._ecl_unformatted import lazy_read_unformatted
 
 
 class EGridFileFormatError(ValueError):
@@ -725,7 +726,10 @@ class EGridReader:
 
     def __init__(self, filelike, file_format: Format = None):
         self.filelike = filelike
-        self.keyword_generator = lazy_read(filelike, file_format)
+        if file_format == Format.UNFORMATTED:
+            self.keyword_generator = lazy_read_unformatted(filelike)
+        else:
+            self.keyword_generator = lazy_read(filelike, file_format)
 
     def read_section(
         self,
@@ -5,6 +5,7 @@ import numpy as np
 
 import xtgeo
 from xtgeo.grid3d import _gridprop_lowlevel as gl
+from xtgeo.surface import _regsurf_grid3d
 from xtgeo.surface import _regsurf_lowlevel as rl
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 
@@ -106,24 +107,19 @@ def _update_tmpvars(self, force=False):
         one = self._tmp["onegrid"]
         logger.info("Make a tmp onegrid instance... DONE")
         logger.info("Make a set of tmp surfaces for I J locations + depth...")
-        self._tmp["topd"] = xtgeo.surface_from_grid3d(
-            one, where="top", mode="depth", rfactor=4
-        )
-        self._tmp["topi"] = xtgeo.surface_from_grid3d(
-            one, where="top", mode="i", rfactor=4
-        )
-        self._tmp["topj"] = xtgeo.surface_from_grid3d(
-            one, where="top", mode="j", rfactor=4
-        )
-        self._tmp["basd"] = xtgeo.surface_from_grid3d(
-            one, where="base", mode="depth", rfactor=4
-        )
-        self._tmp["basi"] = xtgeo.surface_from_grid3d(
-            one, where="base", mode="i", rfactor=4
-        )
-        self._tmp["basj"] = xtgeo.surface_from_grid3d(
-            one, where="base", mode="j", rfactor=4
-        )
+        # one sampling of the grid gives depth, I and J for all map nodes
+        template = None
+        for where, key in (("top", "top"), ("base", "bas")):
+            args, ivalues, jvalues = _regsurf_grid3d.from_grid3d(
+                one, template=template, where=where, mode="depth", rfactor=4
+            )
+            self._tmp[key + "d"] = xtgeo.RegularSurface(**args)
+            shape = (args["ncol"], args["nrow"])
+            args["values"] = np.ma.masked_invalid(ivalues.reshape(shape))
+            self._tmp[key + "i"] = xtgeo.RegularSurface(**args)
+            args["values"] = np.ma.masked_invalid(jvalues.reshape(shape))
+            self._tmp[key + "j"] = xtgeo.RegularSurface(**args)
+            template = self._tmp[key + "d"]
 
         self._tmp["topi"].fill()
         self._tmp["topj"].fill()
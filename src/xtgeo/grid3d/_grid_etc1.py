@@ -1,5 +1,6 @@
 """Private module, Grid ETC 1 methods, info/modify/report."""
 
+import threading
 from collections import OrderedDict
 from copy import deepcopy
 from math import atan2, degrees
@@ -23,6 +24,11 @@ xtg = XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
 
+# serializes the xtgformat conversions, so threads sharing a grid never see the
+# format flag and the geometry arrays out of step; reentrant so callers may hold
+# it while converting and picking up the arrays
+XTGFORMAT_LOCK = threading.RLock()
+
 
 # Note that "self" is the grid instance
 
@@ -78,120 +84,138 @@ method_factory = {
 }
 
 
-def get_dz(
-    self,
-    name: str = "dZ",
-    flip: bool = True,
-    asmasked: bool = True,
-    metric="z projection",
-) -> GridProperty:
-    """Get average cell height (dz) as property.
-
-    Args:
-        flip (bool): whether to flip the z direction, ie. increasing z is
-            increasing depth (defaults to True)
-        asmasked (bool): Whether to mask property by whether
-        name (str): Name of resulting grid property, defaults to "dZ".
-    """
-    self._xtgformat2()
-    nx, ny, nz = self.dimensions
-    result = np.zeros((nx * ny * nz))
+def _get_metric(metric):
     try:
-        metric_fun = method_factory[metric]
+        return method_factory[metric]
     except KeyError as err:
         raise ValueError(f"Unknown metric {metric}") from err
-    _cxtgeo.grdcp3d_calc_dz(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv.ravel(),
-        self._zcornsv.ravel(),
-        result,
-        metric_fun,
-    )
 
-    if not flip:
-        result *= -1
 
-    if asmasked:
-        result = np.ma.masked_array(result, self._actnumsv == 0)
-    else:
-        result = np.ma.masked_array(result, False)
+def _calc_dxdydz(self, metrics):
+    """Compute dx, dy and dz in one pass over the grid.
 
-    return GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=result.ravel(),
-        name=name,
-        discrete=False,
-    )
+    Args:
+        metrics: Metric name for each of dx, dy and dz; use None to skip
+            that component.
 
+    Returns:
+        Three 1D arrays (C order), or None for skipped components.
+    """
+    metric_funs = [_get_metric(metric) if metric else None for metric in metrics]
 
-def get_dx(self, name="dX", asmasked=False, metric="horizontal"):
-    try:
-        metric_fun = method_factory[metric]
-    except KeyError as err:
-        raise ValueError(f"Unknown metric {metric}") from err
     self._xtgformat2()
-    nx, ny, nz = self.dimensions
-    result = np.zeros((nx * ny * nz))
-    _cxtgeo.grdcp3d_calc_dx(
+    ntot = self._ncol * self._nrow * self._nlay
+    results = [np.zeros(ntot if metric else 0) for metric in metrics]
+
+    _cxtgeo.grdcp3d_calc_dxdydz(
         self._ncol,
         self._nrow,
         self._nlay,
         self._coordsv.ravel(),
         self._zcornsv.ravel(),
-        result,
-        metric_fun,
+        *results,
+        *metric_funs,
     )
+    return [res if metric else None for res, metric in zip(results, metrics)]
+
 
+def _delta_property(self, values, name, asmasked):
     if asmasked:
-        result = np.ma.masked_array(result, self._actnumsv == 0)
+        values = np.ma.masked_array(values, self._actnumsv.ravel() == 0)
     else:
-        result = np.ma.masked_array(result, False)
+        values = np.ma.masked_array(values, False)
+
     return GridProperty(
         ncol=self._ncol,
         nrow=self._nrow,
         nlay=self._nlay,
-        values=result.reshape((nx, ny, nz)),
+        values=values.reshape((self._ncol, self._nrow, self._nlay)),
         name=name,
         discrete=False,
     )
 
 
-def get_dy(self, name="dX", asmasked=False, metric="horizontal"):
-    try:
-        metric_fun = method_factory[metric]
-    except KeyError as err:
-        raise ValueError(f"Unknown metric {metric}") from err
-    self._xtgformat2()
-    nx, ny, nz = self.dimensions
-    result = np.zeros((nx * ny * nz))
-    _cxtgeo.grdcp3d_calc_dy(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv.ravel(),
-        self._zcornsv.ravel(),
-        result,
-        metric_fun,
+def get_dxdydz(
+    self,
+    names=("dX", "dY", "dZ"),
+    asmasked=True,
+    metric="horizontal",
+    zmetric="z projection",
+    flip=True,
+):
+    """Get dx, dy and dz as three GridProperty objects, computed in one pass."""
+    deltax, deltay, deltaz = _calc_dxdydz(self, (metric, metric, zmetric))
+    if not flip:
+        deltaz *= -1
+
+    return tuple(
+        _delta_property(self, values, name, asmasked)
+        for values, name in zip((deltax, deltay, deltaz), names)
     )
 
-    if asmasked:
-        result = np.ma.masked_array(result, self._actnumsv == 0)
-    else:
-        result = np.ma.masked_array(result, False)
-    return GridProperty(
-        ncol=self._ncol,
-        nrow=self._nrow,
-        nlay=self._nlay,
-        values=result.reshape((nx, ny, nz)),
-        name=name,
-        discrete=False,
+
+def get_dxdy(self, names=("dX", "dY"), asmasked=False, metric="horizontal"):
+    """Get dx and dy as two GridProperty objects, computed in one pass."""
+    deltax, deltay, _ = _calc_dxdydz(self, (metric, metric, None))
+    return (
+        _delta_property(self, deltax, names[0], asmasked),
+        _delta_property(self, deltay, names[1], asmasked),
     )
 
 
+def get_delta_metrics(self, direction="x", metrics=None):
+    """Get dx, dy or dz for several metrics as one (nmetrics, ncol, nrow, nlay) array.
+
+    Each metric is a separate call to the C kernel, but only the requested
+    direction is computed in each call.
+    """
+    directions = ("x", "y", "z")
+    if direction not in directions:
+        raise ValueError(f"Direction must be one of {directions}, got {direction}")
+    if metrics is None:
+        metrics = tuple(method_factory)
+
+    result = np.zeros((len(metrics), self._ncol, self._nrow, self._nlay))
+    for num, metric in enumerate(metrics):
+        components = [metric if name == direction else None for name in directions]
+        values = _calc_dxdydz(self, components)[directions.index(direction)]
+        result[num] = values.reshape(self.dimensions)
+    return result
+
+
+def get_dz(
+    self,
+    name: str = "dZ",
+    flip: bool = True,
+    asmasked: bool = True,
+    metric="z projection",
+) -> GridProperty:
+    """Get average cell height (dz) as property.
+
+    Args:
+        flip (bool): whether to flip the z direction, ie. increasing z is
+            increasing depth (defaults to True)
+        asmasked (bool): Whether to mask property by whether
+        name (str): Name of resulting grid property, defaults to "dZ".
+    """
+    _, _, result = _calc_dxdydz(self, (None, None, metric))
+
+    if not flip:
+        result *= -1
+
+    return _delta_property(self, result, name, asmasked)
+
+
+def get_dx(self, name="dX", asmasked=False, metric="horizontal"):
+    result, _, _ = _calc_dxdydz(self, (metric, None, None))
+    return _delta_property(self, result, name, asmasked)
+
+
+def get_dy(self, name="dX", asmasked=False, metric="horizontal"):
+    _, result, _ = _calc_dxdydz(self, (None, metric, None))
+    return _delta_property(self, result, name, asmasked)
+
+
 def get_bulk_volume(self, name="bulkvol", asmasked=True, precision=2):
     """Get cell bulk volume as a GridProperty() instance."""
     self._xtgformat2()
@@ -380,10 +404,8 @@ def get_ijk_from_points(
     return result
 
 
-def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
-    """Get X Y Z as properties."""
-    # TODO: May be issues with asmasked vs activeonly here?
-
+def get_xyz_values(self, asmasked=True):
+    """Get X Y Z of cell centers as 1D arrays, with UNDEF for inactive if asmasked."""
     self._xtgformat1()
 
     xv = np.zeros(self.ntotal, dtype=np.float64)
@@ -406,6 +428,14 @@ def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
         zv,
         option,
     )
+    return xv, yv, zv
+
+
+def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
+    """Get X Y Z as properties."""
+    # TODO: May be issues with asmasked vs activeonly here?
+
+    xv, yv, zv = get_xyz_values(self, asmasked=asmasked)
 
     xv = np.ma.masked_greater(xv, xtgeo.UNDEF_LIMIT)
     yv = np.ma.masked_greater(yv, xtgeo.UNDEF_LIMIT)
@@ -441,7 +471,9 @@ def get_xyz(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS"), asmasked=True):
     return xo, yo, zo
 
 
-def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
+def get_xyz_cell_corners(
+    self, ijk=(1, 1, 1), activeonly=True, zerobased=False, out=None
+):
     """Get X Y Z cell corners for one cell."""
     self._xtgformat1()
 
@@ -452,8 +484,14 @@ def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
         shift = 1
 
     if activeonly:
-        actnum = self.get_actnum()
-        iact = actnum.values3d[i - 1 + shift, j - 1 + shift, k - 1 + shift]
+        # actnum is in fortran order in xtgformat=1
+        iact = self._actnumsv[
+            np.ravel_multi_index(
+                (i - 1 + shift, j - 1 + shift, k - 1 + shift),
+                self.dimensions,
+                order="F",
+            )
+        ]
         if iact == 0:
             return None
 
@@ -486,12 +524,89 @@ def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
             pcorners,
         )
 
-    cornerlist = []
-    for i in range(24):
-        cornerlist.append(_cxtgeo.doublearray_getitem(pcorners, i))
+    corners = _cxtgeo.swig_carr_to_numpy_1d(24, pcorners)
+    _cxtgeo.delete_doublearray(pcorners)
+
+    if out is not None:
+        out[:] = corners
+        return out
+    return tuple(corners.tolist())
+
+
+def get_all_xyz_cell_corners(self):
+    """Get X Y Z cell corners for all cells as one (ncol, nrow, nlay, 24) array.
+
+    This is a vectorized version of the per-cell grdcp3d_corners() in C, using
+    xtgformat=2 directly, so corner order and values are the same.
+    """
+    self._xtgformat2()
+
+    ncol, nrow, nlay = self.dimensions
+    zcornsv = self._zcornsv.astype(np.float64)
+
+    corners = np.zeros((ncol, nrow, nlay, 8, 3), dtype=np.float64)
+
+    # the four pillars of a cell as (i offset, j offset, zcorn index on that pillar)
+    pillars = ((0, 0, 3), (1, 0, 2), (0, 1, 1), (1, 1, 0))
+
+    for num, (ioff, joff, zind) in enumerate(pillars):
+        coords = self._coordsv[ioff : ioff + ncol, joff : joff + nrow, np.newaxis, :]
+        x0, y0, z0 = coords[..., 0], coords[..., 1], coords[..., 2]
+        x1, y1, z1 = coords[..., 3], coords[..., 4], coords[..., 5]
+
+        # as x_linint3d(); collapsed coord lines use the top point
+        collapsed = np.abs(z1 - z0) < 1.0e-05
+        zdiff = np.where(collapsed, 1.0, z1 - z0)
+
+        for lay in (0, 1):
+            zval = zcornsv[
+                ioff : ioff + ncol, joff : joff + nrow, lay : lay + nlay, zind
+            ]
+            ratio = np.where(collapsed, 0.0, (zval - z0) / zdiff)
+            corners[:, :, :, 4 * lay + num, 0] = x0 + ratio * (x1 - x0)
+            corners[:, :, :, 4 * lay + num, 1] = y0 + ratio * (y1 - y0)
+            corners[:, :, :, 4 * lay + num, 2] = zval
 
-    clist = tuple(cornerlist)
-    return clist
+    return corners.reshape((ncol, nrow, nlay, 24))
+
+
+def get_layer_corners(self, layer, top=True):
+    """Get X Y Z cell corners for the top or base of one layer as (ncol, nrow, 12).
+
+    Same values as corners 0-11 (top) or 12-23 (base) from grd3d_corners() in C,
+    but computed for the whole layer at once from xtgformat=2 arrays.
+    """
+    if layer < 1 or layer > self.nlay:
+        raise ValueError(f"Layer {layer} is outside range 1..{self.nlay}")
+
+    self._xtgformat2()
+
+    ncol, nrow, _ = self.dimensions
+    kzc = layer - 1 if top else layer
+
+    corners = np.zeros((ncol, nrow, 4, 3), dtype=np.float64)
+
+    # the four pillars of a cell as (i offset, j offset, zcorn index on that pillar)
+    pillars = ((0, 0, 3), (1, 0, 2), (0, 1, 1), (1, 1, 0))
+
+    for num, (ioff, joff, zind) in enumerate(pillars):
+        coords = self._coordsv[ioff : ioff + ncol, joff : joff + nrow, :]
+        xtop, ytop, ztop = coords[..., 0], coords[..., 1], coords[..., 2]
+        xbot, ybot, zbot = coords[..., 3], coords[..., 4], coords[..., 5]
+        zval = self._zcornsv[ioff : ioff + ncol, joff : joff + nrow, kzc, zind]
+        zval = zval.astype(np.float64)
+
+        # keep the arithmetic of grd3d_corners() so results are identical
+        vertical = np.abs(zbot - ztop) <= 0.01
+        zdiff = np.where(vertical, 1.0, zbot - ztop)
+        xval = xtop - (zval - ztop) * (xtop - xbot) / zdiff
+        yval = ytop - (zval - ztop) * (ytop - ybot) / zdiff
+
+        corners[:, :, num, 0] = np.where(vertical, xtop, xval)
+        corners[:, :, num, 1] = np.where(vertical, ytop, yval)
+        corners[:, :, num, 2] = zval
+
+    return corners.reshape((ncol, nrow, 12))
 
 
 def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS")):
@@ -630,35 +745,20 @@ def get_cell_volume(self, ijk=(1, 1, 1), activeonly=True, zerobased=False, preci
 
 def get_layer_slice(self, layer, top=True, activeonly=True):
     """Get X Y cell corners (XY per cell; 5 per cell) as array."""
-    self._xtgformat1()
-    ntot = self._ncol * self._nrow * self._nlay
-
-    opt1 = 0
-    if not top:
-        opt1 = 1
+    ncol, nrow, nlay = self.dimensions
 
-    opt2 = 1
-    if not activeonly:
-        opt2 = 0
+    corners = get_layer_corners(self, layer, top=top).reshape((ncol, nrow, 4, 3))
 
-    icn, lay_array, ic_array = _cxtgeo.grd3d_get_lay_slice(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        self._zcornsv,
-        self._actnumsv,
-        layer,
-        opt1,
-        opt2,
-        10 * ntot,
-        ntot,
-    )
+    # closed polygon XY0 -> XY1 -> XY3 -> XY2 -> XY0 per cell, in C order
+    lay_array = corners[:, :, (0, 1, 3, 2, 0), :2].reshape((ncol * nrow, 5, 2))
 
-    lay_array = lay_array[: 10 * icn]
-    ic_array = ic_array[:icn]
+    ii, jj = np.meshgrid(np.arange(ncol), np.arange(nrow), indexing="ij")
+    ic_array = ((ii * nrow + jj) * nlay + layer - 1).ravel()
 
-    lay_array = lay_array.reshape((icn, 5, 2))
+    if activeonly:
+        active = self._actnumsv[:, :, layer - 1].ravel() != 0
+        lay_array = lay_array[active]
+        ic_array = ic_array[active]
 
     return lay_array, ic_array
 
@@ -1084,38 +1184,55 @@ def reduce_to_one_layer(self):
 
 
 def translate_coordinates(self, translate=(0, 0, 0), flip=(1, 1, 1)):
-    """Translate grid coordinates."""
-    self._xtgformat1()
+    """Translate grid coordinates, in place."""
+    self._xtgformat2()
 
-    tx, ty, tz = translate
-    fx, fy, fz = flip
+    if any(fval not in (1, -1) for fval in flip):
+        raise ValueError(f"The flip values must be 1 or -1, got {flip}")
 
-    ier = _cxtgeo.grd3d_translate(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        fx,
-        fy,
-        fz,
-        tx,
-        ty,
-        tz,
-        self._coordsv,
+    # top and base XYZ of each pillar; shift first, then flip
+    self._coordsv += np.tile(np.asarray(translate, dtype=np.float64), 2)
+    self._coordsv *= np.tile(np.asarray(flip, dtype=np.float64), 2)
+
+    # add in double precision, as the z shift may not be exact in float32
+    np.add(
         self._zcornsv,
+        float(translate[2]),
+        out=self._zcornsv,
+        dtype=np.float64,
+        casting="unsafe",
     )
-    if ier != 0:
-        raise RuntimeError("Something went wrong in translate, code: {}".format(ier))
+    self._zcornsv *= flip[2]
 
     logger.info("Translation of coords done")
 
 
+def rotate(self, angle, pivot=None):
+    """Rotate grid pillars counterclockwise in the XY plane, in place."""
+    self._xtgformat2()
+
+    if pivot is None:
+        pivot = self._coordsv[0, 0, 0:2].copy()
+    pivot = np.asarray(pivot, dtype=np.float64)
+
+    rad = np.radians(angle)
+    rotation = np.array([[np.cos(rad), -np.sin(rad)], [np.sin(rad), np.cos(rad)]])
+
+    # top and base XY of each pillar
+    for start in (0, 3):
+        xyv = self._coordsv[:, :, start : start + 2]
+        xyv[...] = np.einsum("ij,xyj->xyi", rotation, xyv - pivot) + pivot
+
+    logger.info("Rotation of coords done")
+
+
 def reverse_row_axis(self, ijk_handedness=None):
     """Reverse rows (aka flip) for geometry and assosiated properties."""
-    self._xtgformat1()
-
     if ijk_handedness == self.ijk_handedness:
         return
 
+    self._xtgformat1()
+
     ier = _cxtgeo.grd3d_reverse_jrows(
         self._ncol,
         self._nrow,
@@ -1191,12 +1308,12 @@ def get_adjacent_cells(self, prop, val1, val2, activeonly=True):
 
 def estimate_design(self, nsubname):
     """Estimate (guess) (sub)grid design by examing DZ in median thickness column."""
-    actv = self.get_actnum().values
-
-    dzv = self.get_dz(asmasked=False).values
+    # plain arrays here; no need for GridProperty or masked arrays
+    _, _, dzv = _calc_dxdydz(self, (None, None, "z projection"))
+    dzv = dzv.reshape(self.dimensions)
 
     # treat inactive thicknesses as zero
-    dzv[actv == 0] = 0.0
+    dzv[self._actnumsv == 0] = 0.0
 
     if nsubname is None:
         vrange = np.array(range(self.nlay))
@@ -1252,7 +1369,12 @@ def estimate_design(self, nsubname):
 
 def estimate_flip(self):
     """Estimate if grid is left or right handed."""
-    corners = self.get_xyz_cell_corners(activeonly=False)  # for cell 1, 1, 1
+    # top corners of cell 1, 1, 1, read in the current xtgformat so the grid is
+    # left as it is
+    if self._xtgformat == 1:
+        corners = get_xyz_cell_corners(self, activeonly=False)
+    else:
+        corners = get_layer_corners(self, 1)[0, 0]
 
     v1 = (corners[3] - corners[0], corners[4] - corners[1], 0.0)
     v2 = (corners[6] - corners[0], corners[7] - corners[1], 0.0)
@@ -1264,70 +1386,74 @@ def estimate_flip(self):
 
 def _convert_xtgformat2to1(self):
     """Convert arrays from new structure xtgformat=2 to legacy xtgformat=1."""
-    if self._xtgformat == 1:
-        logger.info("No conversion, format is already xtgformat == 1 or unset")
-        return
+    with XTGFORMAT_LOCK:
+        if self._xtgformat == 1:
+            logger.info("No conversion, format is already xtgformat == 1 or unset")
+            return
 
-    logger.info("Convert grid from new xtgformat to legacy format...")
+        logger.info("Convert grid from new xtgformat to legacy format...")
 
-    newcoordsv = np.zeros(((self._ncol + 1) * (self._nrow + 1) * 6), dtype=np.float64)
-    newzcornsv = np.zeros(
-        (self._ncol * self._nrow * (self._nlay + 1) * 4), dtype=np.float64
-    )
-    newactnumsv = np.zeros((self._ncol * self._nrow * self._nlay), dtype=np.int32)
+        newcoordsv = np.zeros(
+            ((self._ncol + 1) * (self._nrow + 1) * 6), dtype=np.float64
+        )
+        newzcornsv = np.zeros(
+            (self._ncol * self._nrow * (self._nlay + 1) * 4), dtype=np.float64
+        )
+        newactnumsv = np.zeros((self._ncol * self._nrow * self._nlay), dtype=np.int32)
 
-    _cxtgeo.grd3cp3d_xtgformat2to1_geom(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        newcoordsv,
-        self._coordsv,
-        newzcornsv,
-        self._zcornsv,
-        newactnumsv,
-        self._actnumsv,
-    )
+        _cxtgeo.grd3cp3d_xtgformat2to1_geom(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            newcoordsv,
+            self._coordsv,
+            newzcornsv,
+            self._zcornsv,
+            newactnumsv,
+            self._actnumsv,
+        )
 
-    self._coordsv = newcoordsv
-    self._zcornsv = newzcornsv
-    self._actnumsv = newactnumsv
-    self._xtgformat = 1
+        self._coordsv = newcoordsv
+        self._zcornsv = newzcornsv
+        self._actnumsv = newactnumsv
+        self._xtgformat = 1
 
-    logger.info("Convert grid from new xtgformat to legacy format... done")
+        logger.info("Convert grid from new xtgformat to legacy format... done")
 
 
 def _convert_xtgformat1to2(self):
     """Convert arrays from old structure xtgformat=1 to new xtgformat=2."""
-    if self._xtgformat == 2 or self._coordsv is None:
-        logger.info("No conversion, format is already xtgformat == 2 or unset")
-        return
+    with XTGFORMAT_LOCK:
+        if self._xtgformat == 2 or self._coordsv is None:
+            logger.info("No conversion, format is already xtgformat == 2 or unset")
+            return
 
-    logger.info("Convert grid from legacy xtgformat to new format...")
+        logger.info("Convert grid from legacy xtgformat to new format...")
 
-    newcoordsv = np.zeros((self._ncol + 1, self._nrow + 1, 6), dtype=np.float64)
-    newzcornsv = np.zeros(
-        (self._ncol + 1, self._nrow + 1, self._nlay + 1, 4), dtype=np.float32
-    )
-    newactnumsv = np.zeros((self._ncol, self._nrow, self._nlay), dtype=np.int32)
+        newcoordsv = np.zeros((self._ncol + 1, self._nrow + 1, 6), dtype=np.float64)
+        newzcornsv = np.zeros(
+            (self._ncol + 1, self._nrow + 1, self._nlay + 1, 4), dtype=np.float32
+        )
+        newactnumsv = np.zeros((self._ncol, self._nrow, self._nlay), dtype=np.int32)
 
-    _cxtgeo.grd3cp3d_xtgformat1to2_geom(
-        self._ncol,
-        self._nrow,
-        self._nlay,
-        self._coordsv,
-        newcoordsv,
-        self._zcornsv,
-        newzcornsv,
-        self._actnumsv,
-        newactnumsv,
-    )
+        _cxtgeo.grd3cp3d_xtgformat1to2_geom(
+            self._ncol,
+            self._nrow,
+            self._nlay,
+            self._coordsv,
+            newcoordsv,
+            self._zcornsv,
+            newzcornsv,
+            self._actnumsv,
+            newactnumsv,
+        )
 
-    self._coordsv = newcoordsv
-    self._zcornsv = newzcornsv
-    self._actnumsv = newactnumsv
-    self._xtgformat = 2
+        self._coordsv = newcoordsv
+        self._zcornsv = newzcornsv
+        self._actnumsv = newactnumsv
+        self._xtgformat = 2
 
-    logger.info("Convert grid from new xtgformat to legacy format... done")
+        logger.info("Convert grid from new xtgformat to legacy format... done")
 
 
 def get_gridquality_properties(self):
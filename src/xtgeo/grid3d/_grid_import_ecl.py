@@ -7,6 +7,8 @@ import xtgeo
 from xtgeo.grid3d._egrid import EGrid, RockModel
 from xtgeo.grid3d._grdecl_grid import GrdeclGrid, GridRelative
 
+from . import _gridprops_io
+
 xtg = xtgeo.XTGeoDialog()
 
 logger = xtg.functionlogger(__name__)
@@ -65,6 +67,27 @@ def import_ecl_run(
     ecl_grid.gridprops = grdprops
 
 
+def scan_ecl_run(groot, ecl_grid):
+    """Scan the names and dates of all INIT and UNRST properties of an ECL run.
+
+    The names and dates are the same as import_ecl_run() gives with "all" props
+    and dates, but only the keyword headers are read.
+
+    Returns:
+        Tuple of (names, dates) lists.
+    """
+    ecl_init = xtgeo._XTGeoFile(groot + ".INIT")
+    ecl_rsta = xtgeo._XTGeoFile(groot + ".UNRST")
+    ecl_init.check_file(raiseerror=OSError)
+    ecl_rsta.check_file(raiseerror=OSError)
+
+    names, dates = _gridprops_io.import_ecl_output_catalog(ecl_init, ecl_grid)
+    rnames, rdates = _gridprops_io.import_ecl_output_catalog(
+        ecl_rsta, ecl_grid, restart=True
+    )
+    return names + rnames, dates + rdates
+
+
 def import_ecl_grdecl(gfile, relative_to=GridRelative.MAP):
     """Import grdecl format."""
 
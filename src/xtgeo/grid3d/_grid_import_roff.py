@@ -1,6 +1,7 @@
 # coding: utf-8
 """Private module, Grid Import private functions for ROFF format."""
 
+import io
 import pathlib
 import tempfile
 import warnings
@@ -98,13 +99,32 @@ def handle_deprecated_xtgeo_roff_file(filelike):
                 inhandle.seek(goback)
 
     else:
-        yield filelike
         if close:
             inhandle.close()
+        else:
+            inhandle.seek(goback)
+        yield filelike
+
+
+def read_roff_binary_into_memory(filelike):
+    """Read a binary roff file into a memory stream in one go.
+
+    The roff parser does many small reads, which are much cheaper from memory
+    than from file. Ascii roff files and streams are returned unchanged, as the
+    parser needs a text stream for the former.
+    """
+    if not isinstance(filelike, (str, pathlib.Path)):
+        return filelike
+    with open(filelike, "rb") as stream:
+        if stream.read(8) != b"roff-bin":
+            return filelike
+        stream.seek(0)
+        return io.BytesIO(stream.read())
 
 
 def import_roff(gfile):
-    with handle_deprecated_xtgeo_roff_file(gfile._file) as converted_file:
+    roff_file = read_roff_binary_into_memory(gfile._file)
+    with handle_deprecated_xtgeo_roff_file(roff_file) as converted_file:
         roff_grid = RoffGrid.from_file(converted_file)
     return {
         "actnumsv": roff_grid.xtgeo_actnum(),
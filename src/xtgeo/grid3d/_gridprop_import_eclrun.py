@@ -3,7 +3,7 @@ import functools
 import itertools
 import operator
 import warnings
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 import ecl_data_io as eclio
 import numpy as np
@@ -16,6 +16,9 @@ from ._grdecl_format import match_keyword
 
 sat_keys = ["SOIL", "SGAS", "SWAT"]
 
+# Keyword types which read_values() imports when names == "all"
+NUMERIC_TYPES = ("INTE", "REAL", "DOUB", "LOGI")
+
 
 def filter_lgr(generator):
     try:
@@ -204,6 +207,25 @@ def read_values(generator, intehead, names, lengths="all"):
         return {name: values[name] for name in names if name in values}
 
 
+def read_names(generator, lengths="all"):
+    """Read the names of the values in the generator, without reading the values.
+
+    Only keyword headers are read. The names are those that
+    :meth:`read_values()` with names="all" gives, in the same order.
+    """
+    names = dict()
+    for entry in generator:
+        if lengths != "all":
+            if entry.read_length() not in lengths:
+                continue
+        kwtype = entry.read_type()
+        if isinstance(kwtype, bytes):
+            kwtype = kwtype.decode("ascii")
+        if kwtype in NUMERIC_TYPES:
+            names[entry.read_keyword().rstrip()] = None
+    return list(names)
+
+
 def check_grid_match(intehead: InteHead, logihead: LogiHead, grid):
     """Checks that the init/restart headers matches the grid
 
@@ -438,6 +460,30 @@ def import_gridprop_from_init_file(
     ]
 
 
+def scan_gridprop_names_from_init_file(init_filelike, grid) -> List[Tuple[str, int]]:
+    """Scans the names of all parameters in an ecl init file.
+
+    Gives the names that :meth:`import_gridprop_from_init_file()` with
+    names="all" would import, but reads only the keyword headers.
+
+    Args:
+        init_filelike: The init file
+        grid: The grid used by the simulator to produce the init file.
+    Returns:
+        List of (name, date) tuples, where date is the date of the init file.
+    """
+    generator = filter_lgr(eclio.lazy_read(init_filelike))
+    intehead, logihead, generator = peek_headers(generator)
+
+    check_grid_match(intehead, logihead, grid)
+
+    date = date_from_intehead(intehead)
+    return [
+        (name, date)
+        for name in read_names(generator, lengths=valid_gridprop_lengths(grid))
+    ]
+
+
 def section_generator(generator):
     """Sections the generator as delimited by "SEQNUM" keyword.
 
@@ -566,3 +612,41 @@ def import_gridprops_from_restart_file(
     if close:
         filehandle.close()
     return read_properties
+
+
+def scan_gridprop_names_from_restart_file(
+    restart_filelike,
+    grid,
+) -> List[Tuple[str, int]]:
+    """Scans the names and dates of all parameters in a restart file.
+
+    Gives the name and date pairs that :meth:`import_gridprops_from_restart_file()`
+    with names="all" and dates="all" would import, but reads only the keyword
+    headers.
+
+    Args:
+        restart_filelike: The restart file.
+        grid: The grid used by the simulator to produce the restart file.
+    Returns:
+        List of (name, date) tuples.
+    """
+    close = False
+    try:
+        filehandle = open(restart_filelike, "rb")
+        close = True
+    except TypeError:
+        filehandle = restart_filelike
+
+    lengths = valid_gridprop_lengths(grid)
+    namedates = []
+    try:
+        sections = section_generator(filter_lgr(eclio.lazy_read(filehandle)))
+        for section in sections:
+            intehead, logihead, section = peek_headers(section)
+            check_grid_match(intehead, logihead, grid)
+            date = date_from_intehead(intehead)
+            namedates += [(name, date) for name in read_names(section, lengths)]
+    finally:
+        if close:
+            filehandle.close()
+    return namedates
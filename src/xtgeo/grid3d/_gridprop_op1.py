@@ -156,5 +156,6 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
     # convert tmp back to correct dtype
     tmp = tmp.astype(dtype)
 
-    self.values[proxyv == proxytarget] = tmp[proxyv == proxytarget]
+    selected = proxyv == proxytarget
+    self.values[selected] = tmp[selected]
     del tmp
@@ -7,6 +7,7 @@ import numpy as np
 
 from xtgeo.common import XTGeoDialog
 
+from . import _grid_etc1
 from ._grid3d import _Grid3D
 
 xtg = XTGeoDialog()
@@ -33,43 +34,33 @@ def dataframe(
         master = self
         logger.info("No Grid instance")
 
+    # the columns are made from plain arrays; intermediate GridProperty
+    # instances would hold masked copies of every column
     if ijk:
         logger.info("IJK is active")
+        dimensions = (master.ncol, master.nrow, master.nlay)
+        ijkv = np.indices(dimensions, dtype=np.int32).reshape(3, -1)
+        ijkv += 1
         if activeonly:
             logger.info("Active cells only")
-            ix, jy, kz = master.get_ijk(asmasked=True)
-            proplist["IX"] = ix.get_active_npvalues1d()
-            proplist["JY"] = jy.get_active_npvalues1d()
-            proplist["KZ"] = kz.get_active_npvalues1d()
+            ijkv = ijkv[:, master.get_actnum().values1d != 0]
         else:
             logger.info("All cells (1)")
-            act = master.get_actnum(dual=True)
-            ix, jy, kz = grid.get_ijk(asmasked=False)
-            proplist["ACTNUM"] = act.values1d
-            proplist["IX"] = ix.values1d
-            proplist["JY"] = jy.values1d
-            proplist["KZ"] = kz.values1d
+            proplist["ACTNUM"] = master.get_actnum(dual=True).values1d
+        proplist["IX"], proplist["JY"], proplist["KZ"] = ijkv
 
     if xyz:
         if grid is None:
             raise ValueError("You ask for xyz but no Grid is present. Use " "grid=...")
 
         logger.info("XYZ is active")
-        option = False
+        xyzv = _grid_etc1.get_xyz_values(grid, asmasked=activeonly)
         if activeonly:
             logger.info("Active cells only")
-            option = True
-
-        xc, yc, zc = grid.get_xyz(asmasked=option)
-        if activeonly:
-            proplist["X_UTME"] = xc.get_active_npvalues1d()
-            proplist["Y_UTMN"] = yc.get_active_npvalues1d()
-            proplist["Z_TVDSS"] = zc.get_active_npvalues1d()
-        else:
-            logger.info("All cells (2)")
-            proplist["X_UTME"] = xc.values1d
-            proplist["Y_UTMN"] = yc.values1d
-            proplist["Z_TVDSS"] = zc.values1d
+            active = grid.get_actnum().values1d != 0
+            xyzv = [values[active] for values in xyzv]
+        for name, values in zip(("X_UTME", "Y_UTMN", "Z_TVDSS"), xyzv):
+            proplist[name] = values
 
     logger.info("Proplist: %s", proplist)
 
@@ -10,6 +10,8 @@ from ._gridprop_import_eclrun import (
     decorate_name,
     import_gridprop_from_init_file,
     import_gridprops_from_restart_file,
+    scan_gridprop_names_from_init_file,
+    scan_gridprop_names_from_restart_file,
     valid_gridprop_lengths,
 )
 from .grid_property import GridProperty
@@ -69,6 +71,32 @@ def import_ecl_output(
         )
 
 
+def import_ecl_output_catalog(pfile, grid, restart=False):
+    """Get the names and dates of all INIT or RESTART parameters, but no values.
+
+    The names are the same as an import with names="all" (and dates="all") gives.
+    Only keyword headers are read.
+
+    Returns:
+        Tuple of (names, dates) lists.
+    """
+    if not isinstance(pfile, xtgeo._XTGeoFile):
+        raise RuntimeError("BUG kode 84728, pfile is not a _XTGeoFile instance")
+
+    names = []
+    dates = []
+    if restart:
+        for name, date in scan_gridprop_names_from_restart_file(pfile.file, grid):
+            names.append(decorate_name(name, grid.dualporo, fracture=False, date=date))
+            dates.append(date)
+    else:
+        for name, date in scan_gridprop_names_from_init_file(pfile.file, grid):
+            names.append(name)
+            dates.append(date)
+
+    return names, dates
+
+
 def _import_ecl_output_v2_init(self, pfile, names, grid, strict):
     """Import INIT parameters"""
 
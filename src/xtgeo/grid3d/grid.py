@@ -6,7 +6,7 @@ import json
 import warnings
 from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import NamedTuple, Optional, Tuple, Union
 
 import deprecation
 import numpy as np
@@ -36,6 +36,17 @@ xtg = xtgeo.common.XTGeoDialog()
 logger = xtg.functionlogger(__name__)
 
 
+class _CoordsvAxes(NamedTuple):
+    """Per-axis views into the (ncol+1, nrow+1, 6) coordsv array."""
+
+    x_top: np.ndarray
+    y_top: np.ndarray
+    z_top: np.ndarray
+    x_bot: np.ndarray
+    y_bot: np.ndarray
+    z_bot: np.ndarray
+
+
 # --------------------------------------------------------------------------------------
 # Comment on "asmasked" vs "activeonly:
 #
@@ -72,6 +83,12 @@ def _handle_import(grid_constructor, gfile, fformat=None, **kwargs):
         )
         _grid_import_ecl.import_ecl_run(gfile.name, ecl_grid=ecl_grid, **kwargs)
         return ecl_grid
+
+    eclrun_keys = {"initprops", "restartprops", "restartdates"} & set(kwargs)
+    if eclrun_keys:
+        raise ValueError(
+            f"The keys {sorted(eclrun_keys)} only apply to fformat='eclipserun'"
+        )
     return grid_constructor(**_grid_import.from_file(gfile, fformat, **kwargs))
 
 
@@ -479,6 +496,16 @@ class Grid(_Grid3D):
 
         return (ncoord, nzcorn, ntot)
 
+    @property
+    def _coordsv_soa(self):
+        """_CoordsvAxes: The pillar coordinates as six (ncol+1, nrow+1) views.
+
+        The views share memory with ``_coordsv`` (xtgformat=2), so writing to
+        e.g. ``_coordsv_soa.z_top`` updates the grid.
+        """
+        self._xtgformat2()
+        return _CoordsvAxes(*np.moveaxis(self._coordsv, -1, 0))
+
     @property
     def ijk_handedness(self):
         """str: IJK handedness for grids, "right" or "left".
@@ -567,7 +594,7 @@ class Grid(_Grid3D):
     @property
     def nactive(self):
         """int: Returns the number of active cells (read only)."""
-        return len(self.actnum_indices)
+        return int(np.count_nonzero(self._actnumsv))
 
     @property
     def actnum_array(self):
@@ -1377,18 +1404,9 @@ class Grid(_Grid3D):
         actnumv = self._dualactnum.values.copy(order=order)
         actnumv = np.ravel(actnumv, order="K")
 
-        if not fracture:
-            actnumvm = actnumv.copy()
-            actnumvm[(actnumv == 3) | (actnumv == 1)] = 1
-            actnumvm[(actnumv == 2) | (actnumv == 0)] = 0
-            ind = np.flatnonzero(actnumvm)
-        else:
-            actnumvf = actnumv.copy()
-            actnumvf[(actnumv == 3) | (actnumv == 2)] = 1
-            actnumvf[(actnumv == 1) | (actnumv == 0)] = 0
-            ind = np.flatnonzero(actnumvf)
-
-        return ind
+        # 1: matrix active, 2: fracture active, 3: both active
+        active = (2, 3) if fracture else (1, 3)
+        return np.flatnonzero(np.isin(actnumv, active))
 
     @deprecation.deprecated(
         deprecated_in="2.16",
@@ -1489,9 +1507,8 @@ class Grid(_Grid3D):
             act.values[:, :, 4] = 0
             grid.set_actnum(act)
         """
-        val1d = actnum.values.ravel(order="K")
-
         if self._xtgformat == 1:
+            val1d = actnum.values.ravel(order="K")
             self._actnumsv = _gridprop_lowlevel.c2f_order(self, val1d)
         else:
             self._actnumsv = np.ma.filled(actnum.values, fill_value=0).astype(np.int32)
@@ -1586,6 +1603,32 @@ class Grid(_Grid3D):
         """
         return _grid_etc1.get_dy(self, name=name, asmasked=asmasked, metric=metric)
 
+    def get_delta_metrics(self, direction="x", metrics=None):
+        """Return dX, dY or dZ for several metrics stacked in one numpy array.
+
+        This is the same as calling :meth:`get_dx`, :meth:`get_dy` or
+        :meth:`get_dz` once per metric (with ``asmasked=False`` and the
+        default ``flip``), but without making a GridProperty for each.
+
+        Args:
+            direction (str): One of "x", "y" or "z".
+            metrics (sequence of str): Metrics to compute, see :meth:`get_dx`
+                for the list. Default is all of them, in the order listed there.
+
+        Returns:
+            A numpy array of shape (len(metrics), ncol, nrow, nlay).
+
+        Example::
+
+            grd = xtgeo.create_box_grid((10, 10, 5))
+            euclid, horizontal = grd.get_delta_metrics(
+                "x", metrics=("euclid", "horizontal")
+            )
+
+        .. versionadded:: 2.16
+        """
+        return _grid_etc1.get_delta_metrics(self, direction=direction, metrics=metrics)
+
     @deprecation.deprecated(
         deprecated_in="3.0",
         removed_in="4.0",
@@ -1606,9 +1649,48 @@ class Grid(_Grid3D):
             Two XTGeo GridProperty objects (dx, dy).
             XTGeo GridProperty objects containing dy.
         """
-        # return the property objects
-        return self.get_dx(name=names[0], asmasked=asmasked), self.get_dy(
-            name=names[1], asmasked=asmasked
+        return _grid_etc1.get_dxdy(self, names=names, asmasked=asmasked)
+
+    def get_dxdydz(
+        self,
+        names=("dX", "dY", "dZ"),
+        asmasked=True,
+        metric="horizontal",
+        zmetric="z projection",
+        flip=True,
+    ):
+        """Return dX, dY and dZ as three GridProperty objects.
+
+        Gives the same result as :meth:`get_dx`, :meth:`get_dy` and
+        :meth:`get_dz`, but all three are computed in one pass over the grid,
+        which is faster when more than one of them is needed.
+
+        Args:
+            names (tuple): names of properties
+            asmasked (bool). If True, make a np.ma array where inactive cells
+                are masked.
+            metric (str): Metric for dX and dY, see :meth:`get_dx`.
+            zmetric (str): Metric for dZ, see :meth:`get_dz`.
+            flip (bool): Use False for Petrel grids were Z is negative down
+                (experimental)
+
+        Returns:
+            Three XTGeo GridProperty objects (dx, dy, dz).
+
+        Example::
+
+            grd = xtgeo.grid_from_file("gullfaks2.roff")
+            dx, dy, dz = grd.get_dxdydz(metric="euclid")
+
+        .. versionadded:: 2.16
+        """
+        return _grid_etc1.get_dxdydz(
+            self,
+            names=names,
+            asmasked=asmasked,
+            metric=metric,
+            zmetric=zmetric,
+            flip=flip,
         )
 
     def get_cell_volume(
@@ -1806,7 +1888,9 @@ class Grid(_Grid3D):
         # return the objects
         return xcoord, ycoord, zcoord
 
-    def get_xyz_cell_corners(self, ijk=(1, 1, 1), activeonly=True, zerobased=False):
+    def get_xyz_cell_corners(
+        self, ijk=(1, 1, 1), activeonly=True, zerobased=False, out=None
+    ):
         """Return a 8 * 3 tuple x, y, z for each corner.
 
         .. code-block:: none
@@ -1827,10 +1911,13 @@ class Grid(_Grid3D):
             ijk (tuple): A tuple of I J K (NB! cell counting starts from 1
                 unless zerobased is True)
             activeonly (bool): Skip undef cells if set to True.
+            out (np.ndarray): Optional array of 24 floats to write the corners
+                into, e.g. a row in a preallocated array when looping over cells.
 
         Returns:
             A tuple with 24 elements (x1, y1, z1, ... x8, y8, z8)
-                for 8 corners. None if cell is inactive and activeonly=True.
+                for 8 corners, or the ``out`` array if given. None if cell is
+                inactive and activeonly=True.
 
         Example::
 
@@ -1840,13 +1927,37 @@ class Grid(_Grid3D):
 
         Raises:
             RuntimeWarning if spesification is invalid.
+
+        .. versionchanged:: 2.16 Added ``out`` argument.
         """
         clist = _grid_etc1.get_xyz_cell_corners(
-            self, ijk=ijk, activeonly=activeonly, zerobased=zerobased
+            self, ijk=ijk, activeonly=activeonly, zerobased=zerobased, out=out
         )
 
         return clist
 
+    def get_all_xyz_cell_corners(self):
+        """Return x, y, z for each corner of all cells as one numpy array.
+
+        This gives the same values as :meth:`get_xyz_cell_corners` with
+        activeonly=False, but for all cells in one vectorized operation, which is
+        much faster than looping over cells.
+
+        Returns:
+            A numpy array with shape (ncol, nrow, nlay, 24) where the last
+            axis is (x1, y1, z1, ... x8, y8, z8) for the 8 corners, ordered
+            as in :meth:`get_xyz_cell_corners`. Inactive cells are included.
+
+        Example::
+
+            >>> grid = xtgeo.grid_from_file("gullfaks2.roff")
+            >>> corners = grid.get_all_xyz_cell_corners()
+            >>> xyz = corners[44, 12, 1]  # same as ijk=(45, 13, 2)
+
+        .. versionadded:: 2.16
+        """
+        return _grid_etc1.get_all_xyz_cell_corners(self)
+
     def get_xyz_corners(self, names=("X_UTME", "Y_UTMN", "Z_TVDSS")):
         """Returns 8*3 (24) xtgeo.grid3d.GridProperty objects, x, y, z for each corner.
 
@@ -1887,6 +1998,33 @@ class Grid(_Grid3D):
         # return the 24 objects in a long tuple (x1, y1, z1, ... x8, y8, z8)
         return grid_props
 
+    def get_layer_corners(self, layer, top=True):
+        """Get X Y Z corners for the top or base of all cells in one layer.
+
+        This is much faster than looping :meth:`get_xyz_cell_corners` over a
+        layer, as all cells are computed in one go.
+
+        Args:
+            layer (int): K layer, starting with 1 as topmost
+            top (bool): If True use top of cell, otherwise use base
+
+        Returns:
+            A numpy array of shape (ncol, nrow, 12) where the last axis holds
+            the same values as the top (0-11) or base (12-23) corners from
+            :meth:`get_xyz_cell_corners`.
+
+        Raises:
+            ValueError: If layer is outside the grid
+
+        Example::
+
+            grd = xtgeo.grid_from_file("gullfaks2.roff")
+            corners = grd.get_layer_corners(grd.nlay, top=False)
+
+        .. versionadded:: 2.16
+        """
+        return _grid_etc1.get_layer_corners(self, layer, top=top)
+
     def get_layer_slice(self, layer, top=True, activeonly=True):
         """Get numpy arrays for cell coordinates e.g. for plotting.
 
@@ -2123,11 +2261,32 @@ class Grid(_Grid3D):
             flip (tuple): Flip array. The flip values must be 1 or -1.
 
         Raises:
-            RuntimeError: If translation goes wrong for unknown reasons
+            ValueError: If a flip value is not 1 or -1
+
+        .. versionchanged:: 2.16 Raises ValueError instead of RuntimeError
         """
         _grid_etc1.translate_coordinates(self, translate=translate, flip=flip)
         self._tmp = {}
 
+    def rotate(self, angle, pivot=None):
+        """Rotate the grid in the XY plane, in place.
+
+        Args:
+            angle (float): Rotation angle in degrees, counterclockwise as for
+                the rotation in :func:`xtgeo.create_box_grid`.
+            pivot (tuple): XY point to rotate around. Default is the top of the
+                first pillar, i.e. the outer corner of cell (1, 1).
+
+        Example::
+
+            grd = xtgeo.create_box_grid((30, 20, 3))
+            grd.rotate(30)  # same geometry as create_box_grid(..., rotation=30)
+
+        .. versionadded:: 2.16
+        """
+        _grid_etc1.rotate(self, angle, pivot=pivot)
+        self._tmp = {}
+
     def reverse_row_axis(self, ijk_handedness=None):
         """Reverse the row axis (J indices).
 
@@ -1,6 +1,5 @@
 """The baseplot module."""
 import deprecation
-import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
 
 import xtgeo
@@ -17,6 +16,8 @@ class BasePlot(object):
 
     def __init__(self):
         """Init method."""
+        import matplotlib.pyplot as plt
+
         clsname = "{}.{}".format(type(self).__module__, type(self).__name__)
         logger.info(clsname)
 
@@ -78,6 +79,8 @@ class BasePlot(object):
                 from 0 index. Default is just keep the linear sequence as is.
 
         """
+        import matplotlib.pyplot as plt
+
         valid_maps = sorted(m for m in plt.cm.datad)
 
         logger.info("Valid color maps: %s", valid_maps)
@@ -191,6 +194,8 @@ class BasePlot(object):
 
 
         """
+        import matplotlib.pyplot as plt
+
         # self._fig, (ax1, ax2) = plt.subplots(2, figsize=(11.69, 8.27))
         self._fig, self._ax = plt.subplots(
             figsize=(11.69 * figscaling, 8.27 * figscaling)
@@ -209,6 +214,8 @@ class BasePlot(object):
         Returns:
             True of plotting is done; otherwise False
         """
+        import matplotlib.pyplot as plt
+
         if self._tight:
             self._fig.tight_layout()
 
@@ -227,6 +234,8 @@ class BasePlot(object):
         After close is called, no more operations can be performed on the plot.
 
         """
+        import matplotlib.pyplot as plt
+
         for fig in self._allfigs:
             plt.close(fig)
 
@@ -252,6 +261,8 @@ class BasePlot(object):
         .. versionchanged:: 2.4 added kwargs option
 
         """
+        import matplotlib.pyplot as plt
+
         if self._tight:
             self._fig.tight_layout()
 
@@ -1,7 +1,6 @@
 """Module for 3D Grid slice plots, using matplotlib."""
 
 
-import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
 from matplotlib.collections import PatchCollection
 
@@ -152,6 +151,7 @@ class Grid3DSlice(BasePlot):
     #     # plt.gca().set_aspect("equal", adjustable="box")
 
     def _plot_layer(self):
+        import matplotlib.pyplot as plt
 
         xyc, ibn = self._grid.get_layer_slice(self._index, activeonly=self._active)
 
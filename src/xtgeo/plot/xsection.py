@@ -7,7 +7,6 @@ import math
 import numpy.ma as ma
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from matplotlib import collections as mc
 from matplotlib.lines import Line2D
 from scipy.ndimage.filters import gaussian_filter
@@ -58,6 +57,8 @@ class XSection(BasePlot):
         outline=None,
     ):
         """Init method."""
+        import matplotlib.pyplot as plt
+
         super().__init__()
 
         self._zmin = zmin
@@ -262,6 +263,8 @@ class XSection(BasePlot):
 
 
         """
+        import matplotlib.pyplot as plt
+
         # overriding the base class canvas
 
         plt.rcParams["axes.xmargin"] = 0  # fill the plot margins
@@ -437,6 +440,8 @@ class XSection(BasePlot):
 
     def set_xaxis_md(self, gridlines=False):
         """Set x-axis labels to measured depth."""
+        import matplotlib.pyplot as plt
+
         md_start = self._well.dataframe["MDEPTH"].iloc[0]
         md_start_round = int(math.floor(md_start / 100.0)) * 100
         md_start_delta = md_start - md_start_round
@@ -1,7 +1,6 @@
 """Module for map plots of surfaces, using matplotlib."""
 
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as mplp
 from matplotlib import ticker
 import numpy as np
@@ -55,6 +54,8 @@ class Map(BasePlot):
         logarithmic=False,
     ):  # pylint: disable=too-many-statements
         """Input a surface and plot it."""
+        import matplotlib.pyplot as plt
+
         # need a deep copy to avoid changes in the original surf
 
         logger.info("The key contourlevels %s is not in use", contourlevels)
@@ -157,19 +157,14 @@ def _export_irap_binary_python(self, mfile):
         0,
         28,
     )
-    inum = self.nrow * self.ncol
-
-    # export to Irap binary in ncol chunks (the only chunk size accepted by RMS)
-    nchunk = self.ncol
-    chunks = [nchunk] * (inum // nchunk)
-    if (inum % nchunk) > 0:
-        chunks.append(inum % nchunk)
-    start = 0
-    for chunk in chunks:
-        ap += struct.pack(">i", chunk * 4)
-        ap += struct.pack(">{:d}f".format(chunk), *vals[start : start + chunk])
-        ap += struct.pack(">i", chunk * 4)
-        start += chunk
+
+    # export to Irap binary in ncol chunks (the only chunk size accepted by RMS),
+    # i.e. one record per row, each enclosed by its byte count
+    records = np.empty((self.nrow, self.ncol + 2), dtype=">f4")
+    records[:, 1:-1] = vals.reshape(self.nrow, self.ncol)
+    markers = records.view(">i4")
+    markers[:, 0] = markers[:, -1] = self.ncol * 4
+    ap += records.tobytes()
 
     if mfile.memstream:
         mfile.file.write(ap)
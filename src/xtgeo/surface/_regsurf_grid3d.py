@@ -8,7 +8,7 @@ import numpy.ma as ma
 import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.common import XTGeoDialog
-from xtgeo.grid3d import _gridprop_lowlevel
+from xtgeo.grid3d import _grid_etc1
 
 xtg = XTGeoDialog()
 
@@ -37,7 +37,8 @@ def slice_grid3d(self, grid, prop, zsurf=None, sbuffer=1):
 
     nsurf = self.ncol * self.nrow
 
-    p_prop = _gridprop_lowlevel.update_carray(prop, discrete=False)
+    # the property values as one float64 array in the (Fortran) order of the grid
+    propv = ma.filled(prop.values.astype(np.float64), xtgeo.UNDEF).ravel(order="F")
 
     istat, updatedval = _cxtgeo.surf_slice_grd3d(
         self.ncol,
@@ -56,7 +57,7 @@ def slice_grid3d(self, grid, prop, zsurf=None, sbuffer=1):
         grid._coordsv,
         grid._zcornsv,
         grid._actnumsv,
-        p_prop,
+        propv,
         sbuffer,
     )
 
@@ -104,14 +105,18 @@ def from_grid3d(grid, template=None, where="top", mode="depth", rfactor=1):
     ivalues = svalues.copy()
     jvalues = svalues.copy()
 
-    grid._xtgformat1()
+    # the C function releases the GIL; convert and pick up the xtgformat=1 arrays
+    # under the format lock so other threads cannot swap them in between
+    with _grid_etc1.XTGFORMAT_LOCK:
+        grid._xtgformat1()
+        coordsv, zcornsv, actnumsv = grid._coordsv, grid._zcornsv, grid._actnumsv
     _cxtgeo.surf_sample_grd3d_lay(
         grid.ncol,
         grid.nrow,
         grid.nlay,
-        grid._coordsv,
-        grid._zcornsv,
-        grid._actnumsv,
+        coordsv,
+        zcornsv,
+        actnumsv,
         klayer,
         args["ncol"],
         args["nrow"],
@@ -154,6 +154,43 @@ def resample(self, other, mask=True):
     self._filesrc = "Resampled"
 
 
+def refine(self, factor):
+    """Bilinear interpolation of values onto a grid with factor times the nodes.
+
+    The refined map spans the same area as the current, so its node (i, j) is at
+    the fractional index i * (ncol - 1) / (ncol * factor - 1) (and likewise for j)
+    in the current map. Returns a masked array, nodes are undefined if any of the
+    four surrounding nodes are undefined.
+    """
+    ncol, nrow = self._ncol, self._nrow
+    zval = ma.filled(self.values, fill_value=0.0)
+    zmask = ma.getmaskarray(self.values)
+
+    # open grids broadcast to the result without a dense index array
+    icol, irow = np.ogrid[: ncol * factor, : nrow * factor]
+    upos = icol * ((ncol - 1) / (ncol * factor - 1))
+    vpos = irow * ((nrow - 1) / (nrow * factor - 1))
+    i0 = np.minimum(upos.astype(np.int64), ncol - 1)
+    j0 = np.minimum(vpos.astype(np.int64), nrow - 1)
+    i1 = np.minimum(i0 + 1, ncol - 1)
+    j1 = np.minimum(j0 + 1, nrow - 1)
+    apos = upos - i0
+    bpos = vpos - j0
+
+    z00 = zval[i0, j0]
+    z10 = zval[i1, j0]
+    z01 = zval[i0, j1]
+    z11 = zval[i1, j1]
+    result = (
+        z00
+        + apos * (z10 - z00)
+        + bpos * (z01 - z00)
+        + apos * bpos * (z11 + z00 - z01 - z10)
+    )
+    mask = zmask[i0, j0] | zmask[i1, j0] | zmask[i0, j1] | zmask[i1, j1]
+    return ma.array(result, mask=mask)
+
+
 def distance_from_point(self, point=(0, 0), azimuth=0.0):
     """Find distance bwteen point and surface."""
     xpv, ypv = point
@@ -536,5 +573,6 @@ def operation_polygons(self, poly, value, opname="add", inside=True):
         tmp = value * 0 + xtgeo.UNDEF
         tmp = ma.masked_greater(tmp, xtgeo.UNDEF_LIMIT)
 
-    self.values[proxyv == proxytarget] = tmp[proxyv == proxytarget]
+    selected = proxyv == proxytarget
+    self.values[selected] = tmp[selected]
     del tmp
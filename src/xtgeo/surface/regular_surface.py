@@ -163,7 +163,12 @@ def surface_from_grid3d(grid, template=None, where="top", mode="depth", rfactor=
             for finer map (but computing time will increase). Will only apply if
             template is None.
 
+    Calls on the same grid may run concurrently in threads when they all use a
+    ``template``, and the grid is not modified by other threads meanwhile. Without
+    a template the grid geometrics are computed first, which is not thread safe.
+
     .. versionadded:: 2.1
+    .. versionchanged:: 2.16 The sampling releases the Python GIL.
     """
     return RegularSurface._read_grid3d(
         grid, template=template, where=where, mode=mode, rfactor=rfactor
@@ -398,11 +403,15 @@ class RegularSurface:
 
         self._values = None
         if values is None:
-            values = np.ma.zeros((self._ncol, self._nrow))
+            # already a valid values array, no need to go through the setter
+            self._values = ma.array(
+                np.zeros((self._ncol, self._nrow)),
+                mask=np.zeros((self._ncol, self._nrow), dtype=bool),
+            )
             self._isloaded = False
         else:
             self._isloaded = True
-        self.values = values
+            self.values = values
 
         if ilines is None:
             self._ilines = np.array(range(1, self._ncol + 1), dtype=np.int32)
@@ -1586,6 +1595,8 @@ class RegularSurface:
             # return two additonal maps
             ic, jr = mymap.from_grid3d(mygrid)
 
+        See :func:`surface_from_grid3d` on use in concurrent threads.
+
         .. versionadded:: 2.1
 
         """
@@ -2386,12 +2397,13 @@ class RegularSurface:
 
         Range for factor is 2 to 10.
 
-        Note that there may be some 'loss' of nodes at the edges of the
-        updated map, as only the 'inside' nodes in the updated map
-        versus the input map are applied.
+        The refined map covers the same area as the input, and its values
+        are bilinear interpolated from the input map nodes.
 
         Args:
             factor (int): Refinement factor
+
+        .. versionchanged:: 2.16 Nodes at the map edges are kept.
         """
         logger.info("Do refining...")
 
@@ -2404,20 +2416,17 @@ class RegularSurface:
         xlen = self._xinc * (self._ncol - 1)
         ylen = self._yinc * (self._nrow - 1)
 
-        proxy = self.copy()
-        self._ncol = proxy.ncol * factor
-        self._nrow = proxy.nrow * factor
+        values = _regsurf_oper.refine(self, factor)
+
+        self._ncol = self._ncol * factor
+        self._nrow = self._nrow * factor
         self._xinc = xlen / (self._ncol - 1)
         self._yinc = ylen / (self._nrow - 1)
 
-        self._values = ma.zeros((self._ncol, self._nrow))
-
         self._ilines = np.array(range(1, self._ncol + 1), dtype=np.int32)
         self._xlines = np.array(range(1, self._nrow + 1), dtype=np.int32)
 
-        self.resample(proxy)
-
-        del proxy
+        self.values = values
         logger.info("Do refining... done")
 
     def coarsen(self, factor):
@@ -2485,8 +2494,9 @@ class RegularSurface:
                 If None, then the surface instance itself is used a slice
                 criteria. Note that zsurf must have same map defs as the
                 surface instance.
-            sbuffer (int): Default is 1; if "holes" after sampling
-                extend this to e.g. 3
+            sbuffer (int): Number of extra map nodes to search around each
+                grid column. Default is 1; the nodes covered by a column are
+                found exactly, so 0 is normally sufficient (and faster).
         Example::
 
             grd = Grid('some.roff')
@@ -2497,6 +2507,9 @@ class RegularSurface:
 
         Raises:
             Exception if maps have different definitions (topology)
+
+        .. versionchanged:: 2.16 Nodes covered by a grid column are no longer missed
+           with a small ``sbuffer``.
         """
         if not isinstance(grid, xtgeo.grid3d.Grid):
             raise ValueError("First argument must be a grid instance")
@@ -205,6 +205,33 @@ def test_surf_sample_grd3d_lay():
         )
 
 
+def test_surf_slice_grd3d_prop_size():
+    with pytest.raises(
+        xtgeo.XTGeoCLibError,
+        match="Incorrect size of property in surf_slice_grd3d",
+    ):
+        _cxtgeo.surf_slice_grd3d(
+            2,
+            2,
+            0.0,
+            1.0,
+            0.0,
+            1.0,
+            0.0,
+            1,
+            np.zeros(4),
+            4,
+            1,
+            1,
+            1,
+            np.zeros(24),
+            np.zeros(32),
+            np.ones(1, dtype=np.int32),
+            np.zeros(5),
+            1,
+        )
+
+
 def test_grd3d_read_eclrecord():
     with pytest.raises(xtgeo.XTGeoCLibError, match="Cannot use file"):
         _cxtgeo.grd3d_read_eclrecord(
@@ -93,3 +93,11 @@ def test_user_msg():
     xtg.warning("This is also a warning")
     xtg.error("This is an error")
     xtg.critical("This is a critical error", sysexit=False)
+
+
+def test_functionlogger_single_handler():
+    """Repeated functionlogger calls for a name shall not stack handlers."""
+    name = "xtgeo.test_functionlogger_single_handler"
+    mylogger = xtg.functionlogger(name)
+    assert xtg.functionlogger(name) is mylogger
+    assert len(mylogger.handlers) == 1
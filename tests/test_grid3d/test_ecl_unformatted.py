@@ -0,0 +1,69 @@
+import io
+
+import ecl_data_io as eclio
+import numpy as np
+import pytest
+
+from xtgeo.grid3d._ecl_unformatted import lazy_read_unformatted
+
+CONTENTS = [
+    ("INTE    ", np.arange(2505, dtype=np.int32)),
+    ("REAL    ", np.linspace(0.0, 1.0, 3000, dtype=np.float32)),
+    ("DOUB    ", np.linspace(0.0, 1.0, 999)),
+    ("LOGI    ", np.array([True, False] * 1001)),
+    ("CHAR    ", np.array([b"ABCDEFGH"] * 230)),
+    ("C016    ", np.array([b"A" * 16] * 3)),
+    ("MESS    ", eclio.MESS),
+    ("EMPTY   ", np.zeros(0, dtype=np.int32)),
+]
+
+
+@pytest.fixture(name="unformatted_file")
+def fixture_unformatted_file():
+    buf = io.BytesIO()
+    eclio.write(buf, CONTENTS)
+    return buf.getvalue()
+
+
+def test_same_as_ecl_data_io(unformatted_file):
+    expected = list(eclio.lazy_read(io.BytesIO(unformatted_file)))
+    entries = list(lazy_read_unformatted(io.BytesIO(unformatted_file)))
+
+    assert len(entries) == len(expected)
+    for entry, expected_entry in zip(entries, expected):
+        assert entry.read_keyword() == expected_entry.read_keyword()
+        assert entry.read_type() == expected_entry.read_type()
+        assert entry.read_length() == expected_entry.read_length()
+
+        values = entry.read_array()
+        expected_values = expected_entry.read_array()
+        if expected_values is eclio.MESS:
+            assert values is eclio.MESS
+        else:
+            assert values.dtype == expected_values.dtype
+            assert np.array_equal(values, expected_values)
+
+
+def test_read_from_file(tmp_path, unformatted_file):
+    (tmp_path / "file.EGRID").write_bytes(unformatted_file)
+    keywords = [
+        entry.read_keyword() for entry in lazy_read_unformatted(tmp_path / "file.EGRID")
+    ]
+    assert keywords == [keyword for keyword, _ in CONTENTS]
+
+
+@pytest.mark.parametrize(
+    "size, message",
+    [(4, "while reading keyword"), (100, "while reading values of INTE")],
+)
+def test_truncated_file(unformatted_file, size, message):
+    with pytest.raises(eclio.EclParsingError, match=message):
+        list(lazy_read_unformatted(io.BytesIO(unformatted_file[:size])))
+
+
+def test_bad_record_marker(unformatted_file):
+    corrupted = bytearray(unformatted_file)
+    # the end marker of the first record of INTE values
+    corrupted[24 + 4 + 4000] = 0xFF
+    with pytest.raises(eclio.EclParsingError, match="Unexpected size of record"):
+        next(lazy_read_unformatted(io.BytesIO(bytes(corrupted)))).read_array()
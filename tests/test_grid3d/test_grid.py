@@ -1,7 +1,10 @@
 """Tests for 3D grid."""
+import copy
 import math
+import os
 import pathlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -9,7 +12,7 @@ from hypothesis import given
 
 import xtgeo
 from xtgeo.common import XTGeoDialog
-from xtgeo.grid3d import Grid, GridProperty
+from xtgeo.grid3d import Grid, GridProperty, _grid_import_ecl
 
 from .grid_generator import dimensions, increments, xtgeo_grids
 
@@ -47,12 +50,18 @@ DUALFIL3 = TPATH / "3dgrids/etc/TEST_DPDK.EGRID"
 # pylint: disable=redefined-outer-name
 
 
-@pytest.fixture()
-def load_gfile1():
-    """Fixture for loading EMEGFILE grid."""
+@pytest.fixture(scope="session")
+def _load_gfile1_cached():
+    """Fixture for loading EMEGFILE grid once, for tests that do not modify it."""
     return xtgeo.grid3d.Grid(EMEGFILE)
 
 
+@pytest.fixture()
+def load_gfile1(_load_gfile1_cached):
+    """Fixture for a unique copy of the EMEGFILE grid, which may be modified."""
+    return copy.deepcopy(_load_gfile1_cached)
+
+
 def test_import_wrong():
     """Importing wrong fformat, etc."""
     with pytest.raises(ValueError):
@@ -190,6 +199,24 @@ def test_roffbin_get_dataframe_for_grid(load_gfile1):
     assert len(df) == grd.ncol * grd.nrow * grd.nlay
 
 
+@pytest.mark.parametrize("activeonly", [True, False])
+def test_get_dataframe_matches_properties(activeonly):
+    grd = xtgeo.create_box_grid((4, 3, 2), rotation=30)
+    actnum = grd._actnumsv.copy()
+    actnum[0, 0, 0] = actnum[3, 1, 1] = 0
+    grd._actnumsv = actnum
+    grd.gridprops = xtgeo.GridProperties()
+
+    dfr = grd.get_dataframe(activeonly=activeonly)
+
+    assert len(dfr) == (grd.nactive if activeonly else grd.ntotal)
+    props = list(grd.get_ijk(asmasked=activeonly))
+    props += list(grd.get_xyz(asmasked=activeonly))
+    for prop in props:
+        expected = prop.get_npvalues1d(activeonly=activeonly)
+        assert np.array_equal(dfr[prop.name].values, expected)
+
+
 def test_subgrids(load_gfile1):
     """Import ROFF and test different subgrid functions."""
     grd = load_gfile1
@@ -214,8 +241,7 @@ def test_subgrids(load_gfile1):
     _i_index, _j_index, k_index = grd.get_ijk()
 
     zprop = k_index.copy()
-    zprop.values[k_index.values > 4] = 2
-    zprop.values[k_index.values <= 4] = 1
+    zprop.values = np.ma.where(k_index.values > 4, 2, 1).astype(np.int32)
     print(zprop.values)
     grd.describe()
     grd.subgrids_from_zoneprop(zprop)
@@ -318,30 +344,31 @@ def test_roffbin_import_v2_banal():
     grd4._convert_xtgformat1to2()
     print("V4: ", xtg.timer(t0))
 
-    for irange in range(grd1.ncol):
-        for jrange in range(grd1.nrow):
-            for krange in range(grd1.nlay):
-                cell = (irange + 1, jrange + 1, krange + 1)
+    xx1 = grd1.get_all_xyz_cell_corners()
+    xx2 = grd2.get_all_xyz_cell_corners()
+    xx3 = grd3.get_all_xyz_cell_corners()
+    xx4 = grd4.get_all_xyz_cell_corners()
 
-                xx1 = grd1.get_xyz_cell_corners(cell, activeonly=False)
-                xx2 = grd2.get_xyz_cell_corners(cell, activeonly=False)
-                xx3 = grd3.get_xyz_cell_corners(cell, activeonly=False)
-                xx4 = grd4.get_xyz_cell_corners(cell, activeonly=False)
+    assert np.allclose(xx1, xx2)
+    assert np.allclose(xx1, xx3)
+    assert np.allclose(xx1, xx4)
 
-                assert np.allclose(np.array(xx1), np.array(xx2)) is True
-                assert np.allclose(np.array(xx1), np.array(xx3)) is True
-                assert np.allclose(np.array(xx1), np.array(xx4)) is True
+
+def _read_grid_dimensions(gfile):
+    """Read a grid, returning only dimensions to avoid pickling the arrays."""
+    return xtgeo.grid_from_file(gfile).dimensions
 
 
 def test_roffbin_import_v2stress():
     """Test roff binary import ROFF using new API, comapre timing etc."""
     t0 = xtg.timer()
-    for _ino in range(100):
-        grd1 = Grid()
-        grd1.from_file(REEKFIL4)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        dims = list(executor.map(_read_grid_dimensions, [REEKFIL4] * 100))
     t1 = xtg.timer(t0)
     print("100 loops with ROXAPIV 2 took: ", t1)
 
+    assert len(set(dims)) == 1
+
 
 def test_roffbin_banal6():
     """Test roff binary for banal no. 6 case."""
@@ -352,17 +379,23 @@ def test_roffbin_banal6():
     grd2._xtgformat = 2
     grd2.from_file(BANAL6)
 
-    assert grd1.get_xyz_cell_corners() == grd2.get_xyz_cell_corners()
+    def assert_same_storage():
+        assert grd1._xtgformat == grd2._xtgformat
+        assert np.array_equal(grd1._coordsv, grd2._coordsv)
+        assert np.array_equal(grd1._zcornsv, grd2._zcornsv)
+        assert np.array_equal(grd1._actnumsv, grd2._actnumsv)
 
-    assert grd1.get_xyz_cell_corners((4, 2, 3)) == grd2.get_xyz_cell_corners((4, 2, 3))
+    grd1._xtgformat2()
+    grd2._xtgformat2()
+    assert_same_storage()
 
     grd2._convert_xtgformat2to1()
-
-    assert grd1.get_xyz_cell_corners((4, 2, 3)) == grd2.get_xyz_cell_corners((4, 2, 3))
+    grd1._xtgformat1()
+    assert_same_storage()
 
     grd2._convert_xtgformat1to2()
-
-    assert grd1.get_xyz_cell_corners((4, 2, 3)) == grd2.get_xyz_cell_corners((4, 2, 3))
+    grd1._xtgformat2()
+    assert_same_storage()
 
 
 def test_roffbin_export_v2_banal6(tmp_path):
@@ -390,17 +423,53 @@ def test_benchmark_get_xyz_cell_cornerns(benchmark, xtgformat):
         grd._xtgformat1()
     else:
         grd._xtgformat2()
+    grd._coordsv = np.ascontiguousarray(grd._coordsv)
+    grd._zcornsv = np.ascontiguousarray(grd._zcornsv)
 
     def run():
         return grd.get_xyz_cell_corners((5, 6, 7))
 
-    corners = benchmark(run)
+    # one call takes microseconds, so time many per round
+    corners = benchmark.pedantic(run, iterations=1000, rounds=10, warmup_rounds=1)
 
     assert corners == pytest.approx(
         [4, 5, 6, 5, 5, 6, 4, 6, 6, 5, 6, 6, 4, 5, 7, 5, 5, 7, 4, 6, 7, 5, 6, 7]
     )
 
 
+def test_get_xyz_cell_corners_out():
+    grd = xtgeo.create_box_grid(dimension=(3, 2, 2))
+    grd._actnumsv[2, 1, 1] = 0
+
+    cells = [(1, 1, 1), (3, 2, 2), (2, 1, 2)]
+    buf = np.zeros((len(cells), 24))
+    for num, cell in enumerate(cells):
+        result = grd.get_xyz_cell_corners(cell, activeonly=False, out=buf[num])
+        expected = grd.get_xyz_cell_corners(cell, activeonly=False)
+        assert np.shares_memory(result, buf[num])
+        assert tuple(result) == expected
+        assert tuple(buf[num]) == expected
+
+    assert grd.get_xyz_cell_corners((3, 2, 2), out=buf[0]) is None
+
+
+@pytest.mark.parametrize("rotation, flip", [(0.0, 1), (30.0, -1), (190.0, 1)])
+def test_get_all_xyz_cell_corners(rotation, flip):
+    grd = xtgeo.create_box_grid(
+        dimension=(4, 5, 3), increment=(10, 20, 3), rotation=rotation, flip=flip
+    )
+    grd._zcornsv[:, :, 1:-1, :] += 0.5
+    grd._coordsv[:, :, 3] += 2.0
+
+    corners = grd.get_all_xyz_cell_corners()
+    assert corners.shape == (4, 5, 3, 24)
+
+    for cell in [(1, 1, 1), (2, 3, 2), (4, 5, 3)]:
+        expected = grd.get_xyz_cell_corners(cell, activeonly=False)
+        i, j, k = cell
+        assert corners[i - 1, j - 1, k - 1] == pytest.approx(expected)
+
+
 def test_roffbin_import_v2_wsubgrids():
     """Test roff binary import ROFF using new API, now with subgrids."""
     grd1 = Grid()
@@ -495,6 +564,24 @@ def test_geometrics_reek():
     assert geom["xmin"] == pytest.approx(456620, abs=1), "Xmin cell center"
 
 
+@pytest.mark.parametrize("xtgformat", [1, 2])
+def test_set_actnum_nactive(xtgformat):
+    grd = xtgeo.create_box_grid((4, 3, 6))
+    if xtgformat == 1:
+        grd._xtgformat1()
+    assert grd.nactive == grd.ntotal
+
+    actnum = grd.get_actnum()
+    actnum.values[:, :, 4:6] = 0
+    grd.set_actnum(actnum)
+    assert grd.nactive == 4 * 3 * 4
+    assert grd.nactive == len(grd.actnum_indices)
+
+    # the grid does not share memory with the property
+    actnum.values[:, :, :] = 0
+    assert grd.nactive == 4 * 3 * 4
+
+
 def test_activate_all_cells(tmp_path):
     """Make the grid active for all cells."""
     grid = Grid(EMEGFILE)
@@ -521,20 +608,29 @@ def test_simple_io(tmp_path):
 
     assert gg.ncol == 40
 
-    filex = tmp_path / "grid_test_simple_io.roff"
+    filer = tmp_path / "grid_test_simple_io.roff"
+    filex = tmp_path / "grid_test_simple_io.EGRID"
+    filey = tmp_path / "grid_test_simple_io.bgrdecl"
 
-    gg.to_file(filex)
+    # the exporters convert to xtgformat 2 in place; do it up front so the
+    # concurrent writes below only read the grid
+    gg._xtgformat2()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(gg.to_file, gfile, fformat=fformat)
+            for gfile, fformat in [
+                (filer, "roff"),
+                (filex, "egrid"),
+                (filey, "bgrdecl"),
+            ]
+        ]
+        for future in futures:
+            future.result()
 
-    gg2 = Grid(filex, fformat="roff")
+    gg2 = Grid(filer, fformat="roff")
 
     assert gg2.ncol == 40
 
-    filex = tmp_path / "grid_test_simple_io.EGRID"
-    filey = tmp_path / "grid_test_simple_io.bgrdecl"
-
-    gg.to_file(filex, fformat="egrid")
-    gg.to_file(filey, fformat="bgrdecl")
-
     gg2 = Grid(filex, fformat="egrid")
     gg3 = Grid(filey, fformat="bgrdecl")
 
@@ -594,6 +690,11 @@ def test_ecl_run_all():
 
     assert len(gg.gridprops.names) == 287
 
+    # scanning the keyword headers gives the same names and dates
+    names, dates = _grid_import_ecl.scan_ecl_run(str(REEKROOT), gg)
+    assert names == gg.gridprops.names
+    assert dates == gg.gridprops.dates
+
 
 def test_ecl_run_all_sp(testpath):
     """Test import an eclrun with all dates and props."""
@@ -609,6 +710,12 @@ def test_ecl_run_all_sp(testpath):
     assert len(gg.gridprops.names) == 59
 
 
+def test_eclrun_keys_other_format():
+    """The eclipserun keys are rejected for other formats."""
+    with pytest.raises(ValueError, match="only apply to fformat='eclipserun'"):
+        xtgeo.grid_from_file("somegrid.roff", fformat="roff", initprops="all")
+
+
 def test_npvalues1d():
     """Different ways of getting np arrays."""
     grd = Grid(DUALFIL3)
@@ -688,13 +795,51 @@ def test_flip(load_gfile1):
     grd.create_box(dimension=(30, 20, 3), flip=-1)
     assert grd.estimate_flip() == -1
 
-    grd.create_box(dimension=(30, 20, 3), rotation=30, flip=-1)
+    grd.rotate(30)
     assert grd.estimate_flip() == -1
 
-    grd.create_box(dimension=(30, 20, 3), rotation=190, flip=-1)
+    grd.rotate(160)
     assert grd.estimate_flip() == -1
 
 
+@pytest.mark.parametrize("flip", [1, -1])
+def test_rotate(flip):
+    grd = xtgeo.create_box_grid((4, 3, 2), origin=(10.0, 20.0, 1000.0), flip=flip)
+    grd.rotate(30)
+    grd.rotate(160)
+
+    expected = xtgeo.create_box_grid(
+        (4, 3, 2), origin=(10.0, 20.0, 1000.0), rotation=190, flip=flip
+    )
+    np.testing.assert_allclose(grd._coordsv, expected._coordsv, atol=1e-8)
+    assert np.array_equal(grd._zcornsv, expected._zcornsv)
+
+    # half a turn around the centre swaps the first and last pillar positions
+    grd = xtgeo.create_box_grid((4, 3, 2), origin=(10.0, 20.0, 1000.0), flip=flip)
+    first, last = grd._coordsv[0, 0].copy(), grd._coordsv[-1, -1].copy()
+    grd.rotate(180, pivot=(first[0:2] + last[0:2]) / 2)
+    np.testing.assert_allclose(grd._coordsv[0, 0], last, atol=1e-8)
+    np.testing.assert_allclose(grd._coordsv[-1, -1], first, atol=1e-8)
+
+
+@pytest.mark.parametrize("xtgformat", [1, 2])
+def test_translate_coordinates(xtgformat):
+    grd = xtgeo.create_box_grid((4, 3, 2), origin=(10.0, 20.0, 1000.0))
+    if xtgformat == 1:
+        grd._xtgformat1()
+    grd.translate_coordinates(translate=(100, 200, 10))
+
+    expected = xtgeo.create_box_grid((4, 3, 2), origin=(110.0, 220.0, 1010.0))
+    assert np.array_equal(grd._coordsv, expected._coordsv)
+    assert np.array_equal(grd._zcornsv, expected._zcornsv)
+
+    grd.translate_coordinates(flip=(1, 1, -1))
+    assert np.array_equal(grd._zcornsv, -expected._zcornsv)
+
+    with pytest.raises(ValueError, match="must be 1 or -1"):
+        grd.translate_coordinates(flip=(1, 0, 1))
+
+
 def test_xyz_cell_corners():
     """Test xyz variations."""
     grd = Grid(DUALFIL1)
@@ -727,6 +872,27 @@ def test_grid_layer_slice():
     assert sarrn[-1, 0, 1] == celll[13]
 
 
+@pytest.mark.parametrize("top", [True, False])
+def test_get_layer_corners(top):
+    grd = xtgeo.create_box_grid((4, 3, 2), rotation=20)
+    grd._zcornsv += np.random.default_rng(1).normal(0, 0.5, grd._zcornsv.shape)
+    grd._coordsv[:, :, 3:5] += 2.0
+
+    layer = 2
+    corners = grd.get_layer_corners(layer, top=top)
+    assert corners.shape == (4, 3, 12)
+
+    shift = 0 if top else 12
+    for icol, jrow in [(1, 1), (4, 1), (2, 3)]:
+        cell = grd.get_xyz_cell_corners(ijk=(icol, jrow, layer))
+        assert np.array_equal(
+            corners[icol - 1, jrow - 1], np.array(cell[shift : shift + 12])
+        )
+
+    with pytest.raises(ValueError, match="outside range"):
+        grd.get_layer_corners(3)
+
+
 def test_generate_hash():
     """Generate hash for two grid instances with same input and compare."""
     grd1 = Grid(REEKFILE)
@@ -821,21 +987,25 @@ def test_bad_egrid_ends_before_kw(tmp_path):
         xtgeo.grid_from_file(egrid_file, fformat="egrid")
 
 
+ALL_METRICS = (
+    "euclid",
+    "north south vertical",
+    "east west vertical",
+    "horizontal",
+    "x projection",
+    "y projection",
+    "z projection",
+)
+
+
 @given(dimensions, increments, increments, increments)
 def test_grid_get_dx(dimension, dx, dy, dz):
     grd = Grid()
     grd.create_box(dimension=dimension, increment=(dx, dy, dz), rotation=0.0)
-    np.testing.assert_allclose(grd.get_dx(metric="euclid").values, dx, atol=0.01)
-    np.testing.assert_allclose(
-        grd.get_dx(metric="north south vertical").values, 0.0, atol=0.01
-    )
-    np.testing.assert_allclose(
-        grd.get_dx(metric="east west vertical").values, dx, atol=0.01
-    )
-    np.testing.assert_allclose(grd.get_dx(metric="horizontal").values, dx, atol=0.01)
-    np.testing.assert_allclose(grd.get_dx(metric="x projection").values, dx, atol=0.01)
-    np.testing.assert_allclose(grd.get_dx(metric="y projection").values, 0.0, atol=0.01)
-    np.testing.assert_allclose(grd.get_dx(metric="z projection").values, 0.0, atol=0.01)
+    metrics = grd.get_delta_metrics("x", metrics=ALL_METRICS)
+    expected = np.array([dx, 0.0, dx, dx, dx, 0.0, 0.0])
+    expected = np.broadcast_to(expected[:, None, None, None], metrics.shape)
+    np.testing.assert_allclose(metrics, expected, atol=0.01)
 
     grd._actnumsv[0, 0, 0] = 0
 
@@ -847,17 +1017,10 @@ def test_grid_get_dx(dimension, dx, dy, dz):
 def test_grid_get_dy(dimension, dx, dy, dz):
     grd = Grid()
     grd.create_box(dimension=dimension, increment=(dx, dy, dz), rotation=0.0)
-    np.testing.assert_allclose(grd.get_dy(metric="euclid").values, dy, atol=0.01)
-    np.testing.assert_allclose(
-        grd.get_dy(metric="north south vertical").values, dy, atol=0.01
-    )
-    np.testing.assert_allclose(
-        grd.get_dy(metric="east west vertical").values, 0.0, atol=0.01
-    )
-    np.testing.assert_allclose(grd.get_dy(metric="horizontal").values, dy, atol=0.01)
-    np.testing.assert_allclose(grd.get_dy(metric="x projection").values, 0.0, atol=0.01)
-    np.testing.assert_allclose(grd.get_dy(metric="y projection").values, dy, atol=0.01)
-    np.testing.assert_allclose(grd.get_dy(metric="z projection").values, 0.0, atol=0.01)
+    metrics = grd.get_delta_metrics("y", metrics=ALL_METRICS)
+    expected = np.array([dy, dy, 0.0, dy, 0.0, dy, 0.0])
+    expected = np.broadcast_to(expected[:, None, None, None], metrics.shape)
+    np.testing.assert_allclose(metrics, expected, atol=0.01)
 
     grd._actnumsv[0, 0, 0] = 0
 
@@ -869,17 +1032,10 @@ def test_grid_get_dy(dimension, dx, dy, dz):
 def test_grid_get_dz(dimension, dx, dy, dz):
     grd = Grid()
     grd.create_box(dimension=dimension, increment=(dx, dy, dz))
-    np.testing.assert_allclose(grd.get_dz(metric="euclid").values, dz, atol=0.01)
-    np.testing.assert_allclose(
-        grd.get_dz(metric="north south vertical").values, dz, atol=0.01
-    )
-    np.testing.assert_allclose(
-        grd.get_dz(metric="east west vertical").values, dz, atol=0.01
-    )
-    np.testing.assert_allclose(grd.get_dz(metric="horizontal").values, 0.0, atol=0.01)
-    np.testing.assert_allclose(grd.get_dz(metric="x projection").values, 0.0, atol=0.01)
-    np.testing.assert_allclose(grd.get_dz(metric="y projection").values, 0.0, atol=0.01)
-    np.testing.assert_allclose(grd.get_dz(metric="z projection").values, dz, atol=0.01)
+    metrics = grd.get_delta_metrics("z", metrics=ALL_METRICS)
+    expected = np.array([dz, dz, dz, 0.0, 0.0, 0.0, dz])
+    expected = np.broadcast_to(expected[:, None, None, None], metrics.shape)
+    np.testing.assert_allclose(metrics, expected, atol=0.01)
     np.testing.assert_allclose(grd.get_dz(flip=False).values, -dz, atol=0.01)
 
     grd._actnumsv[0, 0, 0] = 0
@@ -888,10 +1044,30 @@ def test_grid_get_dz(dimension, dx, dy, dz):
     assert np.isclose(grd.get_dz(asmasked=False).values[0, 0, 0], dz, atol=0.01)
 
 
+def test_get_delta_metrics_is_get_dx():
+    grd = xtgeo.create_box_grid((3, 4, 2), increment=(2.0, 3.0, 1.0), rotation=30)
+    metrics = grd.get_delta_metrics("x", metrics=("euclid", "x projection"))
+    assert metrics.shape == (2, 3, 4, 2)
+    assert np.array_equal(metrics[0], grd.get_dx(metric="euclid").values)
+    assert np.array_equal(metrics[1], grd.get_dx(metric="x projection").values)
+
+    with pytest.raises(ValueError, match="Direction must be"):
+        grd.get_delta_metrics("k")
+
+
 @given(xtgeo_grids)
 def test_get_dxdy_is_get_dx_and_dy(grid):
-    assert np.all(grid.get_dxdy(asmasked=True)[0].values == grid.get_dx().values)
-    assert np.all(grid.get_dxdy(asmasked=True)[1].values == grid.get_dy().values)
+    dx, dy = grid.get_dxdy(asmasked=True)
+    assert np.all(dx.values == grid.get_dx().values)
+    assert np.all(dy.values == grid.get_dy().values)
+
+
+@given(xtgeo_grids)
+def test_get_dxdydz_is_get_dx_dy_and_dz(grid):
+    dx, dy, dz = grid.get_dxdydz(metric="euclid", zmetric="euclid", flip=False)
+    assert np.all(dx.values == grid.get_dx(metric="euclid").values)
+    assert np.all(dy.values == grid.get_dy(metric="euclid").values)
+    assert np.all(dz.values == grid.get_dz(metric="euclid", flip=False).values)
 
 
 def test_benchmark_grid_get_dz(benchmark):
@@ -953,9 +1129,10 @@ def test_grid_get_dxdydz_bad_grid_top():
     grd = Grid()
     grd.create_box(dimension=(10, 10, 10))
 
-    grd._coordsv[:, :, 2] = 0.0
-    grd._coordsv[:, :, 5] = 0.0
-    grd._coordsv[:, :, 0] += 1.0
+    pillars = grd._coordsv_soa
+    pillars.z_top[:] = 0.0
+    pillars.z_bot[:] = 0.0
+    pillars.x_top[:] += 1.0
 
     with pytest.raises(xtgeo.XTGeoCLibError, match="has near zero height"):
         grd.get_dx()
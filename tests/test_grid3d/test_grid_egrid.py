@@ -203,6 +203,7 @@ def test_egrid_read_write(tmp_path, egrid):
     tmp_file = tmp_path / "grid.EGRID"
     egrid.to_file(tmp_file)
     assert xtge.EGrid.from_file(tmp_file) == egrid
+    assert xtge.EGrid.from_file(tmp_file, fileformat="egrid") == egrid
 
 
 @settings(
@@ -5,6 +5,7 @@ from os.path import join
 
 import pytest
 
+import xtgeo
 from xtgeo.common import XTGeoDialog
 from xtgeo.grid3d import Grid, GridProperty
 
@@ -179,6 +180,28 @@ def test_reverse_row_axis_box(tmpdir):
     grd.to_file(join(tmpdir, "reverse_right.grdecl"), fformat="grdecl")
 
 
+@pytest.mark.parametrize("xtgformat", [1, 2])
+def test_reverse_row_axis_and_handedness_setter(xtgformat):
+    """Reverse rows directly and via ijk_handedness, starting in both formats."""
+    grd = xtgeo.create_box_grid((2, 3, 1), increment=(100, 100, 2))
+    if xtgformat == 1:
+        grd._xtgformat1()
+    else:
+        grd._xtgformat2()
+
+    assert grd.ijk_handedness == "left"
+    assert grd._xtgformat == xtgformat
+
+    grd.reverse_row_axis()
+    assert grd.ijk_handedness == "right"
+
+    grd.ijk_handedness = "left"
+    assert grd.ijk_handedness == "left"
+
+    grd.ijk_handedness = "left"  # no change
+    assert grd.ijk_handedness == "left"
+
+
 def test_reverse_row_axis_dual(tmpdir):
     """Reverse axis for distorted but small grid"""
 
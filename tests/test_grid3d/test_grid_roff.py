@@ -11,9 +11,13 @@ from hypothesis import given
 from hypothesis.extra.numpy import arrays
 from numpy.testing import assert_allclose
 
+import xtgeo
 import xtgeo.cxtgeo._cxtgeo as _cxtgeo
 from xtgeo.grid3d import Grid
-from xtgeo.grid3d._grid_import_roff import handle_deprecated_xtgeo_roff_file
+from xtgeo.grid3d._grid_import_roff import (
+    handle_deprecated_xtgeo_roff_file,
+    read_roff_binary_into_memory,
+)
 from xtgeo.grid3d._roff_grid import RoffGrid
 
 from .grid_generator import dimensions, xtgeo_grids
@@ -353,3 +357,19 @@ def test_deprecated_fileread(roff_grid):
             new_grid = RoffGrid.from_file(converted_buff)
 
     assert new_grid == roff_grid
+
+
+def test_read_roff_binary_into_memory(tmp_path):
+    grid = xtgeo.create_box_grid((3, 4, 5))
+    grid.to_file(tmp_path / "grid.roff", fformat="roff_binary")
+    grid.to_file(tmp_path / "grid_ascii.roff", fformat="roff_ascii")
+
+    assert isinstance(read_roff_binary_into_memory(tmp_path / "grid.roff"), io.BytesIO)
+    assert read_roff_binary_into_memory(tmp_path / "grid_ascii.roff") == (
+        tmp_path / "grid_ascii.roff"
+    )
+
+    grid2 = xtgeo.grid_from_file(tmp_path / "grid.roff")
+    assert_allclose(grid2._coordsv, grid._coordsv)
+    assert_allclose(grid2._zcornsv, grid._zcornsv)
+    assert np.array_equal(grid2._actnumsv, grid._actnumsv)
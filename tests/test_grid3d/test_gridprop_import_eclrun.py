@@ -513,3 +513,22 @@ def test_gridprop_init_same_formatted(tmp_path, ecl_run):
 
     assert init_gridprop.name == finit_gridprop.name
     assert np.array_equal(init_gridprop.values, finit_gridprop.values)
+
+
+@given(ecl_runs)
+def test_gridprop_ecl_run_scan_names_same_as_import(ecl_run):
+    imported = xtg_im_ecl.import_gridprop_from_init_file(
+        ecl_run.init_file, names="all", grid=ecl_run.grid
+    )
+    scanned = xtg_im_ecl.scan_gridprop_names_from_init_file(
+        ecl_run.init_file, grid=ecl_run.grid
+    )
+    assert scanned == [(params["name"], params["date"]) for params in imported]
+
+    imported = xtg_im_ecl.import_gridprops_from_restart_file(
+        ecl_run.unrst_file, names="all", dates="all", grid=ecl_run.grid
+    )
+    scanned = xtg_im_ecl.scan_gridprop_names_from_restart_file(
+        ecl_run.unrst_file, grid=ecl_run.grid
+    )
+    assert scanned == [(params["name"], params["date"]) for params in imported]
@@ -10,6 +10,16 @@ def test_default_values():
     assert surf.values.data.tolist() == [[0.0, 0.0], [0.0, 0.0]]
 
 
+def test_copy_values():
+    surf = RegularSurface(2, 2, 0.0, 0.0, values=[1, 2, 3, 1e33])
+    surf_copy = surf.copy()
+    assert surf_copy.values.data.tolist() == surf.values.data.tolist()
+    assert surf_copy.values.mask.tolist() == [[False, False], [False, True]]
+
+    surf_copy.values[0, 0] = 5.0
+    assert surf.values[0, 0] == 1.0
+
+
 @pytest.mark.parametrize(
     "input_val, expected_result",
     [
@@ -200,6 +200,23 @@ def test_refine(tmpdir, reek_map, generate_plot):
         xs.quickplot(filename=join(tmpdir, "reek_refined4.png"))
 
 
+def test_refine_plane():
+    """Refining a rotated planar surface shall keep it planar, also at the edges."""
+    xs = RegularSurface(
+        xori=1000, yori=2000, ncol=7, nrow=5, xinc=25, yinc=30, rotation=30, yflip=-1
+    )
+    xval, yval = xs.get_xy_values()
+    xs.values = 0.01 * xval + 0.02 * yval
+
+    xs.refine(3)
+    assert (xs.ncol, xs.nrow) == (21, 15)
+    assert xs.xinc == pytest.approx(25 * 6 / 20)
+
+    xval, yval = xs.get_xy_values()
+    assert xs.values.count() == 21 * 15
+    np.testing.assert_allclose(xs.values, 0.01 * xval + 0.02 * yval)
+
+
 def test_coarsen(tmpdir, reek_map, generate_plot):
     """Do a coarsening of a surface."""
     xs = reek_map
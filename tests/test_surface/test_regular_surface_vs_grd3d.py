@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 
 import numpy as np
@@ -27,18 +28,56 @@ RPROP1 = RPATH2 / "REEK.INIT"
 RGRD2 = RPATH2 / "reek_sim_grid.roff"
 RPROP2 = RPATH2 / "reek_sim_zone.roff"
 
+# pylint: disable=redefined-outer-name
 
-def test_get_surface_from_grd3d_porosity(tmpdir, generate_plot):
+
+@pytest.fixture(scope="session")
+def reek_top_surface():
+    """Fixture for loading the REEK top surface once; tests work on copies."""
+    return xtgeo.surface_from_file(RTOP1)
+
+
+@pytest.fixture(scope="session")
+def reek_egrid():
+    """Fixture for loading the REEK EGRID grid once, for tests that do not modify it."""
+    return xtgeo.grid3d.Grid(RGRD1, fformat="egrid")
+
+
+@pytest.fixture(scope="session")
+def reek_poro(reek_egrid):
+    """Fixture for loading the REEK INIT porosity once."""
+    return xtgeo.grid3d.GridProperty(
+        RPROP1, fformat="init", name="PORO", grid=reek_egrid
+    )
+
+
+@pytest.fixture(scope="session")
+def reek_roff_grid():
+    """Fixture for loading the REEK roff grid once, for tests that do not modify it."""
+    return xtgeo.grid3d.Grid(RGRD2, fformat="roff")
+
+
+@pytest.fixture(scope="session")
+def reek_zone(reek_roff_grid):
+    """Fixture for loading the REEK roff zone property once."""
+    return xtgeo.grid3d.GridProperty(
+        RPROP2, fformat="roff", name="Zone", grid=reek_roff_grid
+    )
+
+
+def test_get_surface_from_grd3d_porosity(
+    tmpdir, generate_plot, reek_top_surface, reek_egrid, reek_poro
+):
     """Sample a surface from a 3D grid"""
 
-    surf = xtgeo.surface_from_file(RTOP1)
+    surf = reek_top_surface.copy()
     print(surf.values.min(), surf.values.max())
-    grd = xtgeo.grid3d.Grid(RGRD1, fformat="egrid")
+    grd = reek_egrid
     surf.values = 1700
     zsurf = surf.copy()
     surfr = surf.copy()
     surf2 = surf.copy()
-    phi = xtgeo.grid3d.GridProperty(RPROP1, fformat="init", name="PORO", grid=grd)
+    phi = reek_poro
 
     # slice grd3d
     surf.slice_grid3d(grd, phi)
@@ -62,19 +101,21 @@ def test_get_surface_from_grd3d_porosity(tmpdir, generate_plot):
     if generate_plot:
         surf2.quickplot(filename=join(tmpdir, "surf_slice_grd3d_reek_zslice.png"))
 
-    assert np.allclose(surf.values, surf2.values)
+    np.testing.assert_array_equal(surf.values, surf2.values)
 
     assert surf.values.mean() == pytest.approx(0.1667, abs=0.01)
     assert surfr.values.mean() == pytest.approx(0.1667, abs=0.01)
 
 
-def test_get_surface_from_grd3d_zones(tmpdir, generate_plot):
+def test_get_surface_from_grd3d_zones(
+    tmpdir, generate_plot, reek_top_surface, reek_roff_grid, reek_zone
+):
     """Sample a surface from a 3D grid, using zones"""
 
-    surf = xtgeo.surface_from_file(RTOP1)
-    grd = xtgeo.grid3d.Grid(RGRD2, fformat="roff")
+    surf = reek_top_surface.copy()
+    grd = reek_roff_grid
     surf.values = 1700
-    zone = xtgeo.grid3d.GridProperty(RPROP2, fformat="roff", name="Zone", grid=grd)
+    zone = reek_zone
 
     # slice grd3d
     surf.slice_grid3d(grd, zone, sbuffer=1)
@@ -85,11 +126,13 @@ def test_get_surface_from_grd3d_zones(tmpdir, generate_plot):
 
 
 @pytest.mark.filterwarnings("ignore:Default values*")
-def test_surface_from_grd3d_layer(tmpdir, generate_plot, default_surface):
+def test_surface_from_grd3d_layer(
+    tmpdir, generate_plot, default_surface, reek_roff_grid
+):
     """Create a surface from a 3D grid layer"""
 
     surf = xtgeo.surface.RegularSurface(**default_surface)
-    grd = xtgeo.grid3d.Grid(RGRD2, fformat="roff")
+    grd = reek_roff_grid
     surf = xtgeo.surface_from_grid3d(grd)
 
     surf.fill()
@@ -114,3 +157,158 @@ def test_surface_from_grd3d_layer(tmpdir, generate_plot, default_surface):
     surf.to_file(join(tmpdir, "surf_from_grid3d_3base.gri"))
     if generate_plot:
         surf.quickplot(filename=join(tmpdir, "surf_from_grid3d_3base.png"))
+
+
+@pytest.mark.parametrize("rotation", [0.0, 30.0])
+def test_slice_grid3d_box(rotation):
+    """Slice a box grid where the property is the layer number."""
+    grd = xtgeo.create_box_grid(
+        (4, 3, 5), increment=(100.0, 100.0, 10.0), origin=(0.0, 0.0, 1000.0)
+    )
+    grd._actnumsv[0, 0, :] = 0
+    layer = xtgeo.GridProperty(
+        grd, name="K", values=np.arange(1, 6)[None, None, :] * np.ones((4, 3, 5))
+    )
+
+    surf = xtgeo.RegularSurface(
+        ncol=20,
+        nrow=15,
+        xori=5.0,
+        yori=5.0,
+        xinc=20.0,
+        yinc=20.0,
+        rotation=rotation,
+        values=1025.0,
+    )
+    surf.slice_grid3d(grd, layer)
+
+    assert surf.values.count() > 0
+    assert np.all(surf.values.compressed() == 3.0)
+
+    # nodes in the inactive column are not sampled
+    xnodes, ynodes = surf.get_xy_values()
+    inactive = (xnodes < 100.0) & (ynodes < 100.0)
+    assert surf.values.mask[np.asarray(inactive)].all()
+
+
+def test_slice_grid3d_box_sbuffer():
+    """All nodes inside the grid are sampled without any extra buffer."""
+    grd = xtgeo.create_box_grid(
+        (10, 8, 6),
+        increment=(50.0, 50.0, 3.0),
+        origin=(1000.0, 2000.0, 1600.0),
+        rotation=25.0,
+    )
+    zone = xtgeo.GridProperty(
+        grd,
+        name="Zone",
+        discrete=True,
+        values=(np.arange(6) // 2 + 1)[None, None, :] * np.ones((10, 8, 6), dtype=int),
+    )
+    surf = xtgeo.RegularSurface(
+        ncol=60,
+        nrow=70,
+        xori=700.0,
+        yori=1950.0,
+        xinc=9.0,
+        yinc=9.0,
+        rotation=10.0,
+        values=1608.5,
+    )
+
+    result = {}
+    for sbuffer in (0, 1, 4):
+        sliced = surf.copy()
+        sliced.slice_grid3d(grd, zone, sbuffer=sbuffer)
+        result[sbuffer] = sliced.values
+
+    assert result[0].count() > 0
+    assert np.all(result[0].compressed() == 2)
+    np.testing.assert_array_equal(result[0].mask, result[1].mask)
+    np.testing.assert_array_equal(result[0].mask, result[4].mask)
+
+
+def test_surface_from_grid3d_box():
+    """Sample top, base and cell indices from a box grid."""
+    grd = xtgeo.create_box_grid(
+        (4, 3, 5), increment=(100.0, 100.0, 10.0), origin=(0.0, 0.0, 1000.0)
+    )
+    tmp = xtgeo.RegularSurface(
+        ncol=20, nrow=15, xori=5.0, yori=5.0, xinc=20.0, yinc=20.0, values=0.0
+    )
+
+    top = xtgeo.surface_from_grid3d(grd, template=tmp, where="top")
+    assert top.values.count() == tmp.ncol * tmp.nrow
+    assert np.allclose(top.values, 1000.0)
+
+    base = xtgeo.surface_from_grid3d(grd, template=tmp, where="2_base")
+    assert np.allclose(base.values, 1020.0)
+
+    xnodes, ynodes = tmp.get_xy_values()
+    icell = xtgeo.surface_from_grid3d(grd, template=tmp, mode="i")
+    jcell = xtgeo.surface_from_grid3d(grd, template=tmp, mode="j")
+    np.testing.assert_array_equal(icell.values, np.floor(xnodes / 100.0) + 1)
+    np.testing.assert_array_equal(jcell.values, np.floor(ynodes / 100.0) + 1)
+
+
+def test_surface_from_grid3d_box_threads():
+    """Surfaces from the same grid may be made concurrently in threads."""
+    grd = xtgeo.create_box_grid(
+        (12, 10, 5), increment=(50.0, 50.0, 10.0), origin=(0.0, 0.0, 1000.0)
+    )
+    tmp = xtgeo.surface_from_grid3d(grd, rfactor=2)
+
+    jobs = [
+        {"mode": "i"},
+        {"mode": "j"},
+        {"mode": "depth", "where": "3_base"},
+        {"mode": "depth", "where": "base"},
+    ]
+    expected = [xtgeo.surface_from_grid3d(grd, template=tmp, **kw) for kw in jobs]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        result = list(
+            executor.map(
+                lambda kw: xtgeo.surface_from_grid3d(grd, template=tmp, **kw), jobs
+            )
+        )
+
+    for res, exp in zip(result, expected):
+        np.testing.assert_array_equal(res.values.mask, exp.values.mask)
+        np.testing.assert_array_equal(res.values, exp.values)
+
+
+def test_surface_from_grid3d_box_threads_xtgformat2():
+    """Threads sharing a grid in xtgformat 2 must not race on the conversion."""
+    dimension = (40, 30, 10)
+    grd = xtgeo.create_box_grid(
+        dimension, increment=(50.0, 50.0, 10.0), origin=(0.0, 0.0, 1000.0)
+    )
+    tmp = xtgeo.surface_from_grid3d(
+        xtgeo.create_box_grid(
+            dimension, increment=(50.0, 50.0, 10.0), origin=(0.0, 0.0, 1000.0)
+        ),
+        rfactor=2,
+    )
+
+    jobs = [
+        {"mode": "i"},
+        {"mode": "j"},
+        {"mode": "depth", "where": "3_base"},
+        {"mode": "depth", "where": "base"},
+    ] * 2
+    expected = [xtgeo.surface_from_grid3d(grd, template=tmp, **kw) for kw in jobs]
+
+    for _ in range(30):
+        grd._xtgformat2()
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            result = list(
+                executor.map(
+                    lambda kw: xtgeo.surface_from_grid3d(grd, template=tmp, **kw),
+                    jobs,
+                )
+            )
+
+        for res, exp in zip(result, expected):
+            np.testing.assert_array_equal(res.values.mask, exp.values.mask)
+            np.testing.assert_array_equal(res.values, exp.values)